@@ -30,7 +30,6 @@ BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP_A']
 TEST_USER_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("connection",
                          [(BASIC_AUTH_CP, get_basic_auth_headers(BASIC_AUTH_CP + "wrong", TEST_USER_PASSWORD))],
                          indirect=True)
@@ -54,7 +54,6 @@ async def _expect_http_upgrade_rejected(headers):
     assert exc.value.status_code == 401
 
 
-@pytest.mark.asyncio
 async def test_tc_a_03():
     # Step 1-2: Upgrade request without Authorization header is rejected.
     await _expect_http_upgrade_rejected(headers={})
@@ -146,7 +146,6 @@ async def assert_tls12_cipher_supported(uri, headers, security_profile):
             pytest.fail(f"Required TLS 1.2 cipher not supported: {cipher}, error={exc}")
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("security_profile", [2, 3])
 async def test_tc_a_04(security_profile):
     if security_profile == 2:
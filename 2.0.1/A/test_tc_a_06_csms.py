@@ -96,7 +96,6 @@ SECURITY_PROFILE_3_CP = os.environ['SECURITY_PROFILE_3_CP_A']
 BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("security_profile", [2, 3])
 async def test_tc_a_06(security_profile):
     if security_profile == 2:
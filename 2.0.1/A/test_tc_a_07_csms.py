@@ -119,7 +119,6 @@ async def assert_tls12_cipher_supported(uri):
             pytest.fail(f"Required TLS 1.2 cipher not supported: {cipher}, error={exc}")
 
 
-@pytest.mark.asyncio
 async def test_tc_a_07():
     cp_id = SECURITY_PROFILE_3_CP
 
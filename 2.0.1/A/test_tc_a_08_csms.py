@@ -96,7 +96,6 @@ TLS_INVALID_CLIENT_KEY = os.environ['TLS_INVALID_CLIENT_KEY']
 SECURITY_PROFILE_3_CP = os.environ['SECURITY_PROFILE_3_CP_A']
 
 
-@pytest.mark.asyncio
 async def test_tc_a_08():
     cp_id = SECURITY_PROFILE_3_CP
     uri = f'{CSMS_WSS_ADDRESS}/{cp_id}'
@@ -61,7 +61,6 @@ import os
 import time
 import logging
 
-import pytest
 import websockets
 
 from ocpp.v201.enums import (
@@ -79,7 +78,6 @@ BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
 
-@pytest.mark.asyncio
 async def test_tc_a_10():
     cp_id = BASIC_AUTH_CP
     uri = f'{CSMS_ADDRESS}/{cp_id}'
@@ -64,7 +64,6 @@ import os
 import time
 import logging
 
-import pytest
 import websockets
 
 from ocpp.v201.enums import (
@@ -84,7 +83,6 @@ SECURITY_PROFILE_3_CP = os.environ['SECURITY_PROFILE_3_CP_A']
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
 
-@pytest.mark.asyncio
 async def test_tc_a_13():
     cp_id = SECURITY_PROFILE_3_CP
     uri = f'{CSMS_WSS_ADDRESS}/{cp_id}'
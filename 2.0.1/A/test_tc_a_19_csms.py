@@ -201,7 +201,6 @@ async def renew_charging_station_certificate(cp_id, ws, timeout):
     return new_cert_path, new_key_path
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("initial_security_profile", [1, 2])
 async def test_tc_a_19(initial_security_profile):
     new_security_profile = initial_security_profile + 1
@@ -45,7 +45,6 @@ BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP_B']
 BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("connection", [(BASIC_AUTH_CP, get_basic_auth_headers(BASIC_AUTH_CP, BASIC_AUTH_CP_PASSWORD))],
                          indirect=True)
 async def test_tc_b_01(connection):
@@ -43,7 +43,6 @@ Post scenario validations:
 """
 
 import asyncio
-import pytest
 import os
 import time
 import logging
@@ -62,7 +61,6 @@ BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
 
-@pytest.mark.asyncio
 async def test_tc_b_06():
     """Get Variables - single value: CSMS requests OCPPCommCtrlr.OfflineThreshold."""
     cp_id = BASIC_AUTH_CP
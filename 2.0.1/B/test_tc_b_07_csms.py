@@ -42,7 +42,6 @@ Post scenario validations:
 """
 
 import asyncio
-import pytest
 import os
 import time
 import logging
@@ -61,7 +60,6 @@ BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
 
-@pytest.mark.asyncio
 async def test_tc_b_07():
     """Get Variables - multiple values: CSMS requests OfflineThreshold and AuthorizeRemoteStart."""
     cp_id = BASIC_AUTH_CP
@@ -44,7 +44,6 @@ Post scenario validations:
 """
 
 import asyncio
-import pytest
 import os
 import time
 import logging
@@ -73,7 +72,6 @@ EXPECTED_VARIABLES = {
 }
 
 
-@pytest.mark.asyncio
 async def test_tc_b_08():
     """Get Variables - limit to max: CSMS must not exceed MaxItemsPerMessageGetVariables."""
     cp_id = BASIC_AUTH_CP
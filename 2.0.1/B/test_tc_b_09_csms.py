@@ -42,7 +42,6 @@ Post scenario validations:
 """
 
 import asyncio
-import pytest
 import os
 import time
 import logging
@@ -63,7 +62,6 @@ BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
 
-@pytest.mark.asyncio
 async def test_tc_b_09():
     """Set Variables - single value: CSMS sets OCPPCommCtrlr.OfflineThreshold."""
     cp_id = BASIC_AUTH_CP
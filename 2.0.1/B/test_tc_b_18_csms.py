@@ -53,7 +53,6 @@ Post scenario validations:
 """
 
 import asyncio
-import pytest
 import os
 import time
 import logging
@@ -76,7 +75,6 @@ CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 CONFIGURED_EVSE_ID = int(os.environ['CONFIGURED_EVSE_ID'])
 
 
-@pytest.mark.asyncio
 async def test_tc_b_18():
     """Get Custom Report - componentCriteria + component/variables with empty and non-empty results."""
     cp_id = BASIC_AUTH_CP
@@ -48,7 +48,6 @@ Post scenario validations:
 """
 
 import asyncio
-import pytest
 import os
 import time
 import logging
@@ -74,7 +73,6 @@ VALID_ID_TOKEN = os.environ['VALID_ID_TOKEN']
 VALID_ID_TOKEN_TYPE = os.environ['VALID_ID_TOKEN_TYPE']
 
 
-@pytest.mark.asyncio
 async def test_tc_b_21():
     """Reset CS - With Ongoing Transaction - OnIdle: scheduled reset after transaction ends."""
     cp_id = BASIC_AUTH_CP
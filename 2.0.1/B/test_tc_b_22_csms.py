@@ -39,7 +39,6 @@ Post scenario validations:
 """
 
 import asyncio
-import pytest
 import os
 import time
 import logging
@@ -65,7 +64,6 @@ VALID_ID_TOKEN = os.environ['VALID_ID_TOKEN']
 VALID_ID_TOKEN_TYPE = os.environ['VALID_ID_TOKEN_TYPE']
 
 
-@pytest.mark.asyncio
 async def test_tc_b_22():
     """Reset CS - With Ongoing Transaction - Immediate: immediate reset stops transaction."""
     cp_id = BASIC_AUTH_CP
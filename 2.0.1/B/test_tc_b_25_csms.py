@@ -32,7 +32,6 @@ Post scenario validations:
 """
 
 import asyncio
-import pytest
 import os
 import time
 import logging
@@ -54,7 +53,6 @@ CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 CONFIGURED_EVSE_ID = int(os.environ['CONFIGURED_EVSE_ID'])
 
 
-@pytest.mark.asyncio
 async def test_tc_b_25():
     """Reset EVSE - Without ongoing transaction: CSMS resets specific EVSE."""
     cp_id = BASIC_AUTH_CP
@@ -38,7 +38,6 @@ Post scenario validations:
 """
 
 import asyncio
-import pytest
 import os
 import time
 import logging
@@ -64,7 +63,6 @@ VALID_ID_TOKEN = os.environ['VALID_ID_TOKEN']
 VALID_ID_TOKEN_TYPE = os.environ['VALID_ID_TOKEN_TYPE']
 
 
-@pytest.mark.asyncio
 async def test_tc_b_26():
     """Reset EVSE - With Ongoing Transaction - OnIdle: scheduled EVSE reset after transaction."""
     cp_id = BASIC_AUTH_CP
@@ -32,7 +32,6 @@ Post scenario validations:
 """
 
 import asyncio
-import pytest
 import os
 import time
 import logging
@@ -58,7 +57,6 @@ VALID_ID_TOKEN = os.environ['VALID_ID_TOKEN']
 VALID_ID_TOKEN_TYPE = os.environ['VALID_ID_TOKEN_TYPE']
 
 
-@pytest.mark.asyncio
 async def test_tc_b_27():
     """Reset EVSE - With Ongoing Transaction - Immediate: immediate EVSE reset stops transaction."""
     cp_id = BASIC_AUTH_CP
@@ -39,7 +39,6 @@ Post scenario validations:
 """
 
 import asyncio
-import pytest
 import os
 import time
 import logging
@@ -60,7 +59,6 @@ BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
 
-@pytest.mark.asyncio
 async def test_tc_b_31():
     """Cold Boot CS - Pending/Rejected - TriggerMessage: CSMS triggers BootNotification."""
     cp_id = BASIC_AUTH_CP
@@ -36,7 +36,6 @@ Post scenario validations:
 """
 
 import asyncio
-import pytest
 import os
 import time
 import logging
@@ -63,7 +62,6 @@ CONFIGURED_OCPP_INTERFACE = os.environ['CONFIGURED_OCPP_INTERFACE']
 CONFIGURED_SECURITY_PROFILE = os.environ['CONFIGURED_SECURITY_PROFILE']
 
 
-@pytest.mark.asyncio
 async def test_tc_b_42():
     """Set new NetworkConnectionProfile - Accepted: CSMS sets network connection profile."""
     cp_id = BASIC_AUTH_CP
@@ -29,7 +29,6 @@ Post scenario validations:
 """
 
 import asyncio
-import pytest
 import os
 import time
 import logging
@@ -51,7 +50,6 @@ BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
 
-@pytest.mark.asyncio
 async def test_tc_b_44():
     """Set new NetworkConnectionProfile - Failed: CS rejects SetNetworkProfileRequest."""
     cp_id = BASIC_AUTH_CP
@@ -40,7 +40,6 @@ BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP_B']
 BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
 
 
-@pytest.mark.asyncio
 async def test_tc_b_58():
     """WebSocket Subprotocol validation: CSMS rejects unsupported and selects supported OCPP version."""
     cp_id = BASIC_AUTH_CP
@@ -43,7 +43,6 @@ from utils import get_basic_auth_headers, validate_schema
 BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP_C']
 BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("connection", [(BASIC_AUTH_CP, get_basic_auth_headers(BASIC_AUTH_CP, BASIC_AUTH_CP_PASSWORD))],
                          indirect=True)
 async def test_tc_c_02(connection):
@@ -46,7 +46,6 @@ Tool validations
 """
 
 import asyncio
-import pytest
 import os
 import time
 import logging
@@ -71,7 +70,6 @@ CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 LOCAL_LIST_VERSION = int(os.environ['LOCAL_LIST_VERSION'])
 
 
-@pytest.mark.asyncio
 async def test_tc_d_01():
     """Send Local Authorization List - Full: CSMS sends a full local auth list."""
     cp_id = BASIC_AUTH_CP
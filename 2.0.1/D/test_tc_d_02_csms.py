@@ -48,7 +48,6 @@ Tool validations
 """
 
 import asyncio
-import pytest
 import os
 import time
 import logging
@@ -73,7 +72,6 @@ CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 LOCAL_LIST_VERSION = int(os.environ['LOCAL_LIST_VERSION'])
 
 
-@pytest.mark.asyncio
 async def test_tc_d_02():
     """Send Local Authorization List - Differential Update: CSMS sends a differential local auth list."""
     cp_id = BASIC_AUTH_CP
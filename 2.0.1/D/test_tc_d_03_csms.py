@@ -53,7 +53,6 @@ Tool validations
 """
 
 import asyncio
-import pytest
 import os
 import time
 import logging
@@ -78,7 +77,6 @@ CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 LOCAL_LIST_VERSION = int(os.environ['LOCAL_LIST_VERSION'])
 
 
-@pytest.mark.asyncio
 async def test_tc_d_03():
     """Send Local Authorization List - Differential Remove: entries have idToken but no idTokenInfo."""
     cp_id = BASIC_AUTH_CP
@@ -37,7 +37,6 @@ Tool validations
 """
 
 import asyncio
-import pytest
 import os
 import time
 import logging
@@ -60,7 +59,6 @@ CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 LOCAL_LIST_VERSION = int(os.environ['LOCAL_LIST_VERSION'])
 
 
-@pytest.mark.asyncio
 async def test_tc_d_08():
     """Get Local List Version - Success: CSMS requests local list version, CS responds with configured version."""
     cp_id = BASIC_AUTH_CP
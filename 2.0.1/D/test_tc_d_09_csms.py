@@ -35,7 +35,6 @@ Tool validations
 """
 
 import asyncio
-import pytest
 import os
 import time
 import logging
@@ -57,7 +56,6 @@ BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
 
-@pytest.mark.asyncio
 async def test_tc_d_09():
     """Get Local List Version - No list available: CSMS requests local list version, CS responds with 0."""
     cp_id = BASIC_AUTH_CP
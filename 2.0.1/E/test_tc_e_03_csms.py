@@ -51,7 +51,6 @@ EVSE_ID = int(os.environ['CONFIGURED_EVSE_ID'])
 CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("connection", [
     (BASIC_AUTH_CP, get_basic_auth_headers(BASIC_AUTH_CP, BASIC_AUTH_CP_PASSWORD))
 ], indirect=True)
@@ -58,7 +58,6 @@ SAMPLE_SIGNED_METER_VALUE = SignedMeterValueType(
 )
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("connection", [
     (BASIC_AUTH_CP, get_basic_auth_headers(BASIC_AUTH_CP, BASIC_AUTH_CP_PASSWORD))
 ], indirect=True)
@@ -64,7 +64,6 @@ TRANSACTION_DURATION = int(os.environ['TRANSACTION_DURATION'])
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
 
-@pytest.mark.asyncio
 async def test_tc_e_29():
     """Check Transaction status - ongoing with message in queue (E14.FR.02, E14.FR.04).
     E14.FR.02: The Charging Station receives a GetTransactionStatusRequest with a transactionId AND The transaction with that transactionId has not stopped yet The Charging Station’s response SHALL have ongoingIndicator = true. E. Transactions
@@ -68,7 +68,6 @@ TRANSACTION_DURATION = int(os.environ['TRANSACTION_DURATION'])
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
 
-@pytest.mark.asyncio
 async def test_tc_e_31():
     """Check Transaction status - ended with message in queue (E14.FR.03, E14.FR.04).
     E14.FR.03: The Charging Station receives a GetTransactionStatusRequest with a transactionId AND The transaction with that transactionId has stopped The Charging Station’s response SHALL have ongoingIndicator = false.
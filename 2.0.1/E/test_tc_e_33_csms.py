@@ -64,7 +64,6 @@ TRANSACTION_DURATION = int(os.environ['TRANSACTION_DURATION'])
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
 
-@pytest.mark.asyncio
 async def test_tc_e_33():
     """Check Transaction status - without transactionId - with message in queue (E14.FR.06, E14.FR.07).
     E14.FR.06: The Charging Station receives a GetTransactionStatusRequest without a transactionId The Charging Station’s response SHALL NOT have ongoingIndicator set.
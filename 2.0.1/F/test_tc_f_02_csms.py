@@ -58,7 +58,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -87,7 +86,6 @@ CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
 
-@pytest.mark.asyncio
 async def test_tc_f_02():
     """Remote start transaction - Remote start first - AuthorizeRemoteStart is true."""
     cp_id = BASIC_AUTH_CP
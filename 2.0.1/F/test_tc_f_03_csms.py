@@ -46,7 +46,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -75,7 +74,6 @@ CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
 
-@pytest.mark.asyncio
 async def test_tc_f_03():
     """Remote start transaction - Remote start first - AuthorizeRemoteStart is false."""
     cp_id = BASIC_AUTH_CP
@@ -45,7 +45,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -74,7 +73,6 @@ CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 TRANSACTION_DURATION = int(os.environ['TRANSACTION_DURATION'])
 
 
-@pytest.mark.asyncio
 async def test_tc_f_04():
     """Remote start transaction - Remote start first - Cable plugin timeout."""
     cp_id = BASIC_AUTH_CP
@@ -36,7 +36,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -59,7 +58,6 @@ EVSE_ID = int(os.environ['CONFIGURED_EVSE_ID'])
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
 
-@pytest.mark.asyncio
 async def test_tc_f_12():
     """Trigger message - MeterValues - All EVSE."""
     cp_id = BASIC_AUTH_CP
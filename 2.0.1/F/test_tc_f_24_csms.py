@@ -43,7 +43,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -96,7 +95,6 @@ async def _send_occupied_status(cp, evse_id, connector_id):
     await cp.send_notify_event(data=event_data)
 
 
-@pytest.mark.asyncio
 async def test_tc_f_24():
     """Trigger message - StatusNotification - Specific EVSE - Occupied."""
     cp_id = BASIC_AUTH_CP
@@ -1,4 +1,11 @@
 """
+TC_G_14 / TC_G_17 - Change Availability - With ongoing transaction
+
+Both test cases share the same flow and differ only in the target of the
+ChangeAvailabilityRequest, so they run as one parametrized test:
+    station   -> TC_G_14 (evse omitted)
+    connector -> TC_G_17 (evse.id / evse.connectorId set)
+
 TC_G_14 - Change Availability Charging Station - With ongoing transaction
 Use case: G04 | Requirements: N/a
 System under test: CSMS
@@ -37,6 +44,42 @@ Tool validations:
 Post scenario validations:
     - A respond to report the state of a connector has been received for all connectors.
 
+TC_G_17 - Change Availability Connector - With ongoing transaction
+Use case: G03 | Requirements: N/a
+System under test: CSMS
+
+Description:
+    This test case covers how the CSMS requests the Charging Station to change the availability of one
+    of the EVSEs from Operative to Inoperative. An EVSE is considered Operative in any status other than
+    Faulted and Unavailable.
+
+Purpose:
+    To verify if the CSMS is able to send a change availability request during a transaction according
+    to the mechanism as described at the OCPP specification.
+
+Before:
+    State is EnergyTransferStarted
+
+Main:
+    Note: Request the CSMS to change the availability of one connector to inoperative
+    1. The CSMS sends a ChangeAvailabilityRequest
+    2. CS responds with ChangeAvailabilityResponse (status=Scheduled)
+    Note: Wait for <Configured Transaction Duration>
+    3. Execute Reusable State StopAuthorized
+    4. Execute Reusable State EVConnectedPostSession
+    5. Execute Reusable State EVDisconnected
+    6. CS notifies CSMS (StatusNotificationRequest connectorStatus=Unavailable)
+    7. The CSMS responds accordingly.
+
+Tool validations:
+    * Step 1: ChangeAvailabilityRequest
+      - operationalStatus = Inoperative
+      - evse.id = <Configured evseId>
+      - evse.connectorId = <Configured connectorId>
+
+Post scenario validations:
+    - A respond to report the state of a connector has been received for all connectors.
+
 Configuration:
     CSMS_ADDRESS              - WebSocket URL of the CSMS
     BASIC_AUTH_CP             - Charge Point identifier
@@ -47,17 +90,13 @@ Configuration:
     VALID_ID_TOKEN            - Valid idToken value
     VALID_ID_TOKEN_TYPE       - Valid idToken type
     TRANSACTION_DURATION      - Duration of simulated transaction in seconds (default 5)
+    SEND_INITIAL_AVAILABLE    - Send StatusNotification(Available) right after boot (default true)
 """
 import asyncio
-import logging
 import os
-import sys
 import time
 
 import pytest
-import websockets
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from ocpp.v201.enums import (
     RegistrationStatusEnumType,
@@ -67,15 +106,13 @@ from ocpp.v201.enums import (
 )
 
 from tzi_charge_point import TziChargePoint
-from utils import get_basic_auth_headers, generate_transaction_id, now_iso
+from utils import get_basic_auth_headers, generate_transaction_id, close_charge_point, timeout, connect_with_retry
 from reusable_states.authorized import authorized
 from reusable_states.energy_transfer_started import energy_transfer_started
 from reusable_states.stop_authorized import stop_authorized
 from reusable_states.ev_connected_post_session import ev_connected_post_session
 from reusable_states.ev_disconnected import ev_disconnected
 
-logging.basicConfig(level=logging.INFO)
-
 CSMS_ADDRESS = os.environ['CSMS_ADDRESS']
 BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP_G']
 BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
@@ -85,17 +122,23 @@ CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 VALID_ID_TOKEN = os.environ['VALID_ID_TOKEN']
 VALID_ID_TOKEN_TYPE = os.environ['VALID_ID_TOKEN_TYPE']
 TRANSACTION_DURATION = int(os.environ['TRANSACTION_DURATION'])
+SEND_INITIAL_AVAILABLE = os.environ.get('SEND_INITIAL_AVAILABLE', 'true').lower() == 'true'
 
+_INOPERATIVE = frozenset({OperationalStatusEnumType.inoperative, 'Inoperative'})
 
-@pytest.mark.asyncio
-async def test_tc_g_14():
-    """Change Availability Charging Station - With ongoing transaction."""
+
+@pytest.mark.parametrize("scope", [
+    pytest.param("station", id="tc_g_14"),
+    pytest.param("connector", id="tc_g_17"),
+])
+async def test_tc_g_change_availability(scope):
+    """Change Availability Charging Station / Connector - With ongoing transaction."""
     cp_id = BASIC_AUTH_CP
     uri = f'{CSMS_ADDRESS}/{cp_id}'
     headers = get_basic_auth_headers(cp_id, BASIC_AUTH_CP_PASSWORD)
 
-    ws = await websockets.connect(
-        uri=uri,
+    ws = await connect_with_retry(
+        uri,
         subprotocols=['ocpp2.0.1'],
         extra_headers=headers,
     )
@@ -104,6 +147,9 @@ async def test_tc_g_14():
     cp = TziChargePoint(cp_id, ws)
     cp._change_availability_response_status = ChangeAvailabilityStatusEnumType.scheduled
     start_task = asyncio.create_task(cp.start())
+    # Arm the ChangeAvailability wait before the preconditions run, so a
+    # request the CSMS sends while they are still in progress is not missed.
+    change_availability_received = asyncio.create_task(cp._received_change_availability.wait())
 
     transaction_id = generate_transaction_id()
 
@@ -111,7 +157,8 @@ async def test_tc_g_14():
     boot_response = await cp.send_boot_notification()
     assert boot_response.status == RegistrationStatusEnumType.accepted
 
-    await cp.send_status_notification(CONNECTOR_ID, ConnectorStatusEnumType.available, evse_id=EVSE_ID)
+    if SEND_INITIAL_AVAILABLE:
+        await cp.send_status_notification(CONNECTOR_ID, ConnectorStatusEnumType.available, evse_id=EVSE_ID)
 
     # Before: Execute Reusable State EnergyTransferStarted
     await authorized(cp, id_token_id=VALID_ID_TOKEN, id_token_type=VALID_ID_TOKEN_TYPE,
@@ -120,49 +167,52 @@ async def test_tc_g_14():
                                   transaction_id=transaction_id)
 
     # Step 1-2: Wait for CSMS to send ChangeAvailabilityRequest
-    await asyncio.wait_for(
-        cp._received_change_availability.wait(),
-        timeout=CSMS_ACTION_TIMEOUT,
-    )
+    async with timeout(CSMS_ACTION_TIMEOUT):
+        await change_availability_received
 
     # Validate ChangeAvailabilityRequest content
     assert cp._change_availability_data is not None
     req_data = cp._change_availability_data
-    assert req_data['operational_status'] == OperationalStatusEnumType.inoperative or \
-           req_data['operational_status'] == 'Inoperative', \
+    assert req_data['operational_status'] in _INOPERATIVE, \
         f"Expected operationalStatus=Inoperative, got {req_data['operational_status']}"
 
     evse = req_data.get('evse')
-    assert evse is None, f"Expected evse to be omitted for station-level, got {evse}"
-
-    # Step 3-4: CS notifies CSMS about unoccupied connectors (Unavailable)
-    # Per the spec, only unoccupied connectors report Unavailable at this point.
-    # The configured connector has an ongoing transaction (occupied), so in a
-    # single-connector setup, there are no unoccupied connectors to report.
-    # In a multi-connector setup, other unoccupied connectors would report here.
+    if scope == "station":
+        assert evse is None, f"Expected evse to be omitted for station-level, got {evse}"
+
+        # TC_G_14 Step 3-4: CS notifies CSMS about unoccupied connectors (Unavailable)
+        # Per the spec, only unoccupied connectors report Unavailable at this point.
+        # The configured connector has an ongoing transaction (occupied), so in a
+        # single-connector setup, there are no unoccupied connectors to report.
+        # In a multi-connector setup, other unoccupied connectors would report here.
+    else:
+        assert evse is not None, "Expected evse to be present"
+        if isinstance(evse, dict):
+            assert evse.get('id') == EVSE_ID, \
+                f"Expected evse.id={EVSE_ID}, got {evse.get('id')}"
+            assert evse.get('connector_id') == CONNECTOR_ID, \
+                f"Expected evse.connectorId={CONNECTOR_ID}, got {evse.get('connector_id')}"
 
     # Note: Wait for <Configured Transaction Duration>
     await asyncio.sleep(TRANSACTION_DURATION)
 
-    # Step 5: Execute Reusable State StopAuthorized
+    # Step 5 (TC_G_17: 3): Execute Reusable State StopAuthorized
     await stop_authorized(cp, evse_id=EVSE_ID, connector_id=CONNECTOR_ID,
                           transaction_id=transaction_id)
 
-    # Step 6: Execute Reusable State EVConnectedPostSession
+    # Step 6 (TC_G_17: 4): Execute Reusable State EVConnectedPostSession
     await ev_connected_post_session(cp, evse_id=EVSE_ID, connector_id=CONNECTOR_ID,
                                     transaction_id=transaction_id)
 
-    # Step 7: Execute Reusable State EVDisconnected
+    # Step 7 (TC_G_17: 5): Execute Reusable State EVDisconnected
     await ev_disconnected(cp, evse_id=EVSE_ID, connector_id=CONNECTOR_ID,
                           transaction_id=transaction_id)
 
-    # Step 8-9: CS notifies CSMS about the configured connector - Unavailable
+    # Step 8-9 (TC_G_17: 6-7): CS notifies CSMS about the configured connector - Unavailable
     await cp.send_status_notification(
         connector_id=CONNECTOR_ID,
         status=ConnectorStatusEnumType.unavailable,
         evse_id=EVSE_ID,
     )
 
-    logging.info("TC_G_14 completed successfully")
-    start_task.cancel()
-    await ws.close()
+    await close_charge_point(start_task, ws)
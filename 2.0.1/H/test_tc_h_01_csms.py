@@ -26,30 +26,19 @@ Configuration:
     CSMS_ACTION_TIMEOUT       - Seconds to wait for CSMS action (default 30)
     VALID_ID_TOKEN            - Valid idToken value
     VALID_ID_TOKEN_TYPE       - Valid idToken type
+    SEND_INITIAL_AVAILABLE    - Send StatusNotification(Available) right after boot (default true)
 """
 import asyncio
-import logging
 import os
-import sys
 import time
 
-import pytest
-import websockets
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from ocpp.v201.enums import (
     RegistrationStatusEnumType,
     ConnectorStatusEnumType,
-    EventTriggerEnumType,
-    EventNotificationEnumType,
 )
-from ocpp.v201.datatypes import EventDataType, ComponentType, VariableType, EVSEType
 
 from tzi_charge_point import TziChargePoint
-from utils import get_basic_auth_headers, now_iso
-
-logging.basicConfig(level=logging.INFO)
+from utils import availability_event, get_basic_auth_headers, now_iso, close_charge_point, timeout, connect_with_retry
 
 CSMS_ADDRESS = os.environ['CSMS_ADDRESS']
 BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP']
@@ -59,17 +48,19 @@ CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 VALID_ID_TOKEN = os.environ['VALID_ID_TOKEN']
 VALID_ID_TOKEN_TYPE = os.environ['VALID_ID_TOKEN_TYPE']
+SEND_INITIAL_AVAILABLE = os.environ.get('SEND_INITIAL_AVAILABLE', 'true').lower() == 'true'
+
+_EVSE = {'id': EVSE_ID, 'connector_id': CONNECTOR_ID}
 
 
-@pytest.mark.asyncio
 async def test_tc_h_01():
     """Reserve a specific EVSE - Accepted - Valid idToken."""
     cp_id = BASIC_AUTH_CP
     uri = f'{CSMS_ADDRESS}/{cp_id}'
     headers = get_basic_auth_headers(cp_id, BASIC_AUTH_CP_PASSWORD)
 
-    ws = await websockets.connect(
-        uri=uri,
+    ws = await connect_with_retry(
+        uri,
         subprotocols=['ocpp2.0.1'],
         extra_headers=headers,
     )
@@ -82,14 +73,13 @@ async def test_tc_h_01():
     boot_response = await cp.send_boot_notification()
     assert boot_response.status == RegistrationStatusEnumType.accepted
 
-    await cp.send_status_notification(CONNECTOR_ID, ConnectorStatusEnumType.available, evse_id=EVSE_ID)
+    if SEND_INITIAL_AVAILABLE:
+        await cp.send_status_notification(CONNECTOR_ID, ConnectorStatusEnumType.available, evse_id=EVSE_ID)
 
     # Step 1: Execute Reusable State Reserved
     # Wait for CSMS to send ReserveNowRequest
-    await asyncio.wait_for(
-        cp._received_reserve_now.wait(),
-        timeout=CSMS_ACTION_TIMEOUT,
-    )
+    async with timeout(CSMS_ACTION_TIMEOUT):
+        await cp._received_reserve_now.wait()
 
     # Validate ReserveNowRequest content
     assert cp._reserve_now_data is not None
@@ -113,26 +103,16 @@ async def test_tc_h_01():
     # CS responded with Accepted (handled by on_reserve_now handler)
 
     # CS notifies CSMS about the status change - Reserved
+    timestamp = now_iso()
     await cp.send_status_notification(
         connector_id=CONNECTOR_ID,
         status=ConnectorStatusEnumType.reserved,
         evse_id=EVSE_ID,
+        timestamp=timestamp,
     )
 
     # NotifyEventRequest
-    event_data = [
-        EventDataType(
-            trigger=EventTriggerEnumType.delta,
-            actual_value='Reserved',
-            component=ComponentType(name='Connector', evse=EVSEType(id=EVSE_ID, connector_id=CONNECTOR_ID)),
-            variable=VariableType(name='AvailabilityState'),
-            timestamp=now_iso(),
-            event_id=EVSE_ID,
-            event_notification_type=EventNotificationEnumType.custom_monitor,
-        )
-    ]
-    await cp.send_notify_event(data=event_data)
-
-    logging.info("TC_H_01 completed successfully")
-    start_task.cancel()
-    await ws.close()
+    event_data = availability_event('Reserved', timestamp, EVSE_ID, evse=_EVSE)
+    await cp.send_notify_event(data=event_data, generated_at=timestamp)
+
+    await close_charge_point(start_task, ws)
@@ -48,7 +48,6 @@ import sys
 import time
 from datetime import datetime, timezone
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -78,7 +77,6 @@ VALID_ID_TOKEN_TYPE = os.environ['VALID_ID_TOKEN_TYPE']
 TRANSACTION_DURATION = int(os.environ['TRANSACTION_DURATION'])
 
 
-@pytest.mark.asyncio
 async def test_tc_h_07():
     """Reserve a specific EVSE - Reservation Ended / not used."""
     cp_id = BASIC_AUTH_CP
@@ -42,7 +42,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -70,7 +69,6 @@ VALID_ID_TOKEN = os.environ['VALID_ID_TOKEN']
 VALID_ID_TOKEN_TYPE = os.environ['VALID_ID_TOKEN_TYPE']
 
 
-@pytest.mark.asyncio
 async def test_tc_h_08():
     """Reserve an unspecified EVSE - Accepted."""
     cp_id = BASIC_AUTH_CP
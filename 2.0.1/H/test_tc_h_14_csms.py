@@ -44,7 +44,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -73,7 +72,6 @@ VALID_ID_TOKEN_TYPE = os.environ['VALID_ID_TOKEN_TYPE']
 CONFIGURED_NUMBER_OF_EVSES = int(os.environ['CONFIGURED_NUMBER_OF_EVSES'])
 
 
-@pytest.mark.asyncio
 async def test_tc_h_14():
     """Reserve an unspecified EVSE - Amount of EVSEs equals reservations."""
     cp_id = BASIC_AUTH_CP
@@ -42,7 +42,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -71,7 +70,6 @@ VALID_ID_TOKEN_TYPE = os.environ['VALID_ID_TOKEN_TYPE']
 CONFIGURED_CONNECTOR_TYPE = os.environ['CONFIGURED_CONNECTOR_TYPE']
 
 
-@pytest.mark.asyncio
 async def test_tc_h_15():
     """Reserve a connector with a specific type - Success."""
     cp_id = BASIC_AUTH_CP
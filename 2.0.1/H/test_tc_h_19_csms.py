@@ -37,76 +37,43 @@ Configuration:
     VALID_ID_TOKEN_TYPE       - Valid idToken type
     GROUP_ID                  - Group idToken value
 """
-import asyncio
-import logging
-import os
-import sys
-import time
-
 import pytest
-import websockets
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from ocpp.v201.enums import (
     RegistrationStatusEnumType,
     ConnectorStatusEnumType,
-    EventTriggerEnumType,
-    EventNotificationEnumType,
 )
-from ocpp.v201.datatypes import EventDataType, ComponentType, VariableType, EVSEType
 
-from tzi_charge_point import TziChargePoint
-from utils import get_basic_auth_headers, now_iso
+from utils import CONFIG as C, availability_event, get_basic_auth_headers, now_iso, timeout
 
-logging.basicConfig(level=logging.INFO)
 
-CSMS_ADDRESS = os.environ['CSMS_ADDRESS']
-BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP']
-BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
-EVSE_ID = int(os.environ['CONFIGURED_EVSE_ID'])
-CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
-CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
-VALID_ID_TOKEN = os.environ['VALID_ID_TOKEN']
-VALID_ID_TOKEN_TYPE = os.environ['VALID_ID_TOKEN_TYPE']
-GROUP_ID = os.environ['GROUP_ID']
+_AVAILABLE = ConnectorStatusEnumType.available
+_RESERVED = ConnectorStatusEnumType.reserved
 
 
-@pytest.mark.asyncio
-async def test_tc_h_19():
+@pytest.mark.parametrize("connection", [
+    (C.BASIC_AUTH_CP, get_basic_auth_headers(C.BASIC_AUTH_CP, C.BASIC_AUTH_CP_PASSWORD))
+], indirect=True)
+async def test_tc_h_19(charge_point):
     """Reserve a specific EVSE - Use a reserved EVSE with GroupId."""
-    cp_id = BASIC_AUTH_CP
-    uri = f'{CSMS_ADDRESS}/{cp_id}'
-    headers = get_basic_auth_headers(cp_id, BASIC_AUTH_CP_PASSWORD)
-
-    ws = await websockets.connect(
-        uri=uri,
-        subprotocols=['ocpp2.0.1'],
-        extra_headers=headers,
-    )
-    time.sleep(0.5)
-
-    cp = TziChargePoint(cp_id, ws)
-    start_task = asyncio.create_task(cp.start())
+    cp = charge_point
 
     # Boot and establish session
     boot_response = await cp.send_boot_notification()
     assert boot_response.status == RegistrationStatusEnumType.accepted
 
-    await cp.send_status_notification(CONNECTOR_ID, ConnectorStatusEnumType.available, evse_id=EVSE_ID)
+    await cp.send_status_notification(C.CONNECTOR_ID, _AVAILABLE, evse_id=C.EVSE_ID)
 
     # Step 1-2: Wait for CSMS to send ReserveNowRequest
-    await asyncio.wait_for(
-        cp._received_reserve_now.wait(),
-        timeout=CSMS_ACTION_TIMEOUT,
-    )
+    async with timeout(C.CSMS_ACTION_TIMEOUT):
+        await cp._received_reserve_now.wait()
 
     # Validate ReserveNowRequest content
     assert cp._reserve_now_data is not None
     req_data = cp._reserve_now_data
 
-    assert req_data['evse_id'] == EVSE_ID, \
-        f"Expected evseId={EVSE_ID}, got {req_data['evse_id']}"
+    assert req_data['evse_id'] == C.EVSE_ID, \
+        f"Expected evseId={C.EVSE_ID}, got {req_data['evse_id']}"
     assert req_data.get('connector_type') is None, \
         f"Expected connectorType to be omitted, got {req_data.get('connector_type')}"
 
@@ -116,31 +83,20 @@ async def test_tc_h_19():
 
     id_token = req_data['id_token']
     if isinstance(id_token, dict):
-        assert id_token.get('id_token') == VALID_ID_TOKEN, \
-            f"Expected idToken={VALID_ID_TOKEN}, got {id_token.get('id_token')}"
-        assert id_token.get('type') == VALID_ID_TOKEN_TYPE, \
-            f"Expected idToken.type={VALID_ID_TOKEN_TYPE}, got {id_token.get('type')}"
+        assert id_token.get('id_token') == C.VALID_ID_TOKEN, \
+            f"Expected idToken={C.VALID_ID_TOKEN}, got {id_token.get('id_token')}"
+        assert id_token.get('type') == C.VALID_ID_TOKEN_TYPE, \
+            f"Expected idToken.type={C.VALID_ID_TOKEN_TYPE}, got {id_token.get('type')}"
 
     # Step 3-4: CS notifies CSMS about the status change - Reserved
     await cp.send_status_notification(
-        connector_id=CONNECTOR_ID,
-        status=ConnectorStatusEnumType.reserved,
-        evse_id=EVSE_ID,
+        connector_id=C.CONNECTOR_ID,
+        status=_RESERVED,
+        evse_id=C.EVSE_ID,
     )
 
-    event_data = [
-        EventDataType(
-            trigger=EventTriggerEnumType.delta,
-            actual_value='Reserved',
-            component=ComponentType(name='Connector', evse=EVSEType(id=EVSE_ID, connector_id=CONNECTOR_ID)),
-            variable=VariableType(name='AvailabilityState'),
-            timestamp=now_iso(),
-            event_id=EVSE_ID,
-            event_notification_type=EventNotificationEnumType.custom_monitor,
-        )
-    ]
+    event_data = availability_event(
+        'Reserved', now_iso(), C.EVSE_ID,
+        evse={'id': C.EVSE_ID, 'connector_id': C.CONNECTOR_ID},
+    )
     await cp.send_notify_event(data=event_data)
-
-    logging.info("TC_H_19 completed successfully")
-    start_task.cancel()
-    await ws.close()
@@ -27,16 +27,7 @@ Configuration:
     CONFIGURED_CONNECTOR_ID   - Connector id (default 1)
     CSMS_ACTION_TIMEOUT       - Seconds to wait for CSMS action (default 30)
 """
-import asyncio
-import logging
-import os
-import sys
-import time
-
 import pytest
-import websockets
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from ocpp.v201.enums import (
     RegistrationStatusEnumType,
@@ -44,53 +35,30 @@ from ocpp.v201.enums import (
     ReserveNowStatusEnumType,
 )
 
-from tzi_charge_point import TziChargePoint
-from utils import get_basic_auth_headers
+from utils import CONFIG as C, get_basic_auth_headers, timeout
 
-logging.basicConfig(level=logging.INFO)
 
-CSMS_ADDRESS = os.environ['CSMS_ADDRESS']
-BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP']
-BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
-EVSE_ID = int(os.environ['CONFIGURED_EVSE_ID'])
-CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
-CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
+_AVAILABLE = ConnectorStatusEnumType.available
 
 
-@pytest.mark.asyncio
-async def test_tc_h_22():
+@pytest.mark.parametrize("connection", [
+    (C.BASIC_AUTH_CP, get_basic_auth_headers(C.BASIC_AUTH_CP, C.BASIC_AUTH_CP_PASSWORD))
+], indirect=True)
+async def test_tc_h_22(charge_point):
     """Reserve a specific EVSE - Configured to Reject."""
-    cp_id = BASIC_AUTH_CP
-    uri = f'{CSMS_ADDRESS}/{cp_id}'
-    headers = get_basic_auth_headers(cp_id, BASIC_AUTH_CP_PASSWORD)
-
-    ws = await websockets.connect(
-        uri=uri,
-        subprotocols=['ocpp2.0.1'],
-        extra_headers=headers,
-    )
-    time.sleep(0.5)
-
-    cp = TziChargePoint(cp_id, ws)
+    cp = charge_point
     # Configure CS to reject reservations
     cp._reserve_now_response_status = ReserveNowStatusEnumType.rejected
-    start_task = asyncio.create_task(cp.start())
 
     # Boot and establish session
     boot_response = await cp.send_boot_notification()
     assert boot_response.status == RegistrationStatusEnumType.accepted
 
-    await cp.send_status_notification(CONNECTOR_ID, ConnectorStatusEnumType.available, evse_id=EVSE_ID)
+    await cp.send_status_notification(C.CONNECTOR_ID, _AVAILABLE, evse_id=C.EVSE_ID)
 
     # Step 1-2: Wait for CSMS to send ReserveNowRequest
-    await asyncio.wait_for(
-        cp._received_reserve_now.wait(),
-        timeout=CSMS_ACTION_TIMEOUT,
-    )
+    async with timeout(C.CSMS_ACTION_TIMEOUT):
+        await cp._received_reserve_now.wait()
 
     # CS responded with Rejected (configured before start)
     assert cp._reserve_now_data is not None
-
-    logging.info("TC_H_22 completed successfully")
-    start_task.cancel()
-    await ws.close()
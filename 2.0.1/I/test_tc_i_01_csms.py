@@ -82,7 +82,6 @@ VALID_ID_TOKEN = os.environ['VALID_ID_TOKEN']
 VALID_ID_TOKEN_TYPE = os.environ['VALID_ID_TOKEN_TYPE']
 
 
-@pytest.mark.asyncio
 async def test_tc_i_01():
     """Show EV Driver running total cost during charging - costUpdatedRequest."""
     cp_id = BASIC_AUTH_CP
@@ -42,178 +42,144 @@ Configuration:
     VALID_ID_TOKEN            - Valid idToken value
     VALID_ID_TOKEN_TYPE       - Valid idToken type
 """
-import asyncio
 import logging
-import os
-import sys
 
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from ocpp.v201.call import TransactionEvent
-from ocpp.v201.datatypes import EventDataType, ComponentType, VariableType
 from ocpp.v201.enums import (
     ConnectorStatusEnumType,
     TransactionEventEnumType as TransactionEventType,
     TriggerReasonEnumType as TriggerReasonType,
     ChargingStateEnumType as ChargingStateType,
     ReasonEnumType as StoppedReasonType,
-    EventTriggerEnumType as EventTriggerType,
-    EventNotificationEnumType as EventNotificationType,
 )
 
 from tzi_charge_point import TziChargePoint
-from utils import get_basic_auth_headers, generate_transaction_id, now_iso
+from utils import CONFIG as C, availability_event, get_basic_auth_headers, generate_transaction_id, now_iso
 from reusable_states.stop_authorized import stop_authorized
 from reusable_states.ev_connected_post_session import ev_connected_post_session
 from reusable_states.authorized import authorized
 
-logging.basicConfig(level=logging.INFO)
 
-BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP']
-BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
-VALID_ID_TOKEN = os.environ['VALID_ID_TOKEN']
-VALID_ID_TOKEN_TYPE = os.environ['VALID_ID_TOKEN_TYPE']
-EVSE_ID = int(os.environ['CONFIGURED_EVSE_ID'])
-CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
+_OCCUPIED = ConnectorStatusEnumType.occupied
+_AVAILABLE = ConnectorStatusEnumType.available
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("connection", [
-    (BASIC_AUTH_CP, get_basic_auth_headers(BASIC_AUTH_CP, BASIC_AUTH_CP_PASSWORD))
+    (C.BASIC_AUTH_CP, get_basic_auth_headers(C.BASIC_AUTH_CP, C.BASIC_AUTH_CP_PASSWORD))
 ], indirect=True)
 async def test_tc_i_02(connection):
     """Show EV Driver Final Total Cost After Charging."""
     assert connection.open
 
-    cp = TziChargePoint(BASIC_AUTH_CP, connection)
-    start_task = asyncio.create_task(cp.start())
+    async with TziChargePoint(C.BASIC_AUTH_CP, connection) as cp:
+        transaction_id = generate_transaction_id()
+
+        # Step 1: Execute Reusable State EVConnectedPreSession with required meter begin value
+        timestamp = now_iso()
+        await cp.send_status_notification(
+            connector_id=C.CONNECTOR_ID,
+            status=_OCCUPIED,
+            timestamp=timestamp,
+        )
 
-    transaction_id = generate_transaction_id()
+        occupied_event_data = availability_event('Occupied', timestamp, C.EVSE_ID)
+        await cp.send_notify_event(data=occupied_event_data, generated_at=timestamp)
+
+        ev_connected_event = TransactionEvent(
+            event_type=TransactionEventType.updated,
+            timestamp=timestamp,
+            trigger_reason=TriggerReasonType.cable_plugged_in,
+            seq_no=cp.next_seq_no(),
+            transaction_info={
+                'transaction_id': transaction_id,
+                'charging_state': ChargingStateType.ev_connected,
+            },
+            meter_value=[{
+                'timestamp': timestamp,
+                'sampled_value': [{
+                    'value': 1000,
+                    'context': 'Transaction.Begin',
+                }],
+            }],
+            evse={
+                'id': C.EVSE_ID,
+                'connector_id': C.CONNECTOR_ID,
+            },
+        )
+        ev_connected_response = await cp.send_transaction_event_request(ev_connected_event)
+        assert ev_connected_response is not None
 
-    # Step 1: Execute Reusable State EVConnectedPreSession with required meter begin value
-    await cp.send_status_notification(
-        connector_id=CONNECTOR_ID,
-        status=ConnectorStatusEnumType.occupied,
-    )
+        # Step 2: Execute Reusable State Authorized
+        await authorized(cp, id_token_id=C.VALID_ID_TOKEN, id_token_type=C.VALID_ID_TOKEN_TYPE,
+                         transaction_id=transaction_id, evse_id=C.EVSE_ID, connector_id=C.CONNECTOR_ID,
+                         ev_connected_pre_session=True)
 
-    occupied_event_data = [
-        EventDataType(
-            trigger=EventTriggerType.delta,
-            actual_value='Occupied',
-            component=ComponentType(name='Connector'),
-            variable=VariableType(name='AvailabilityState'),
+        # Step 3: Execute Reusable State EnergyTransferStarted (Part 2 only, already EVConnected)
+        charging_event = TransactionEvent(
+            event_type=TransactionEventType.updated,
             timestamp=now_iso(),
-            event_id=EVSE_ID,
-            event_notification_type=EventNotificationType.custom_monitor,
+            trigger_reason=TriggerReasonType.charging_state_changed,
+            seq_no=cp.next_seq_no(),
+            transaction_info={
+                'transaction_id': transaction_id,
+                'charging_state': ChargingStateType.charging,
+            },
+            evse={
+                'id': C.EVSE_ID,
+                'connector_id': C.CONNECTOR_ID,
+            },
         )
-    ]
-    await cp.send_notify_event(data=occupied_event_data)
-
-    ev_connected_event = TransactionEvent(
-        event_type=TransactionEventType.updated,
-        timestamp=now_iso(),
-        trigger_reason=TriggerReasonType.cable_plugged_in,
-        seq_no=cp.next_seq_no(),
-        transaction_info={
-            'transaction_id': transaction_id,
-            'charging_state': ChargingStateType.ev_connected,
-        },
-        meter_value=[{
-            'timestamp': now_iso(),
-            'sampled_value': [{
-                'value': 1000,
-                'context': 'Transaction.Begin',
-            }],
-        }],
-        evse={
-            'id': EVSE_ID,
-            'connector_id': CONNECTOR_ID,
-        },
-    )
-    ev_connected_response = await cp.send_transaction_event_request(ev_connected_event)
-    assert ev_connected_response is not None
-
-    # Step 2: Execute Reusable State Authorized
-    await authorized(cp, id_token_id=VALID_ID_TOKEN, id_token_type=VALID_ID_TOKEN_TYPE,
-                     transaction_id=transaction_id, evse_id=EVSE_ID, connector_id=CONNECTOR_ID,
-                     ev_connected_pre_session=True)
-
-    # Step 3: Execute Reusable State EnergyTransferStarted (Part 2 only, already EVConnected)
-    charging_event = TransactionEvent(
-        event_type=TransactionEventType.updated,
-        timestamp=now_iso(),
-        trigger_reason=TriggerReasonType.charging_state_changed,
-        seq_no=cp.next_seq_no(),
-        transaction_info={
-            'transaction_id': transaction_id,
-            'charging_state': ChargingStateType.charging,
-        },
-        evse={
-            'id': EVSE_ID,
-            'connector_id': CONNECTOR_ID,
-        },
-    )
-    charging_response = await cp.send_transaction_event_request(charging_event)
-    assert charging_response is not None
-
-    # Step 4-5: Execute Reusable States StopAuthorized and EVConnectedPostSession
-    await stop_authorized(cp, evse_id=EVSE_ID, connector_id=CONNECTOR_ID,
-                          transaction_id=transaction_id)
-    await ev_connected_post_session(cp, evse_id=EVSE_ID, connector_id=CONNECTOR_ID,
-                                    transaction_id=transaction_id)
-
-    # Step 6: StatusNotification - Available
-    await cp.send_status_notification(
-        connector_id=CONNECTOR_ID,
-        status=ConnectorStatusEnumType.available,
-    )
-
-    # Step 6 (cont): NotifyEvent - Available
-    event_data = [
-        EventDataType(
-            trigger=EventTriggerType.delta,
-            actual_value='Available',
-            component=ComponentType(name='Connector'),
-            variable=VariableType(name='AvailabilityState'),
-            timestamp=now_iso(),
-            event_id=EVSE_ID,
-            event_notification_type=EventNotificationType.custom_monitor,
+        charging_response = await cp.send_transaction_event_request(charging_event)
+        assert charging_response is not None
+
+        # Step 4-5: Execute Reusable States StopAuthorized and EVConnectedPostSession
+        await stop_authorized(cp, evse_id=C.EVSE_ID, connector_id=C.CONNECTOR_ID,
+                              transaction_id=transaction_id)
+        await ev_connected_post_session(cp, evse_id=C.EVSE_ID, connector_id=C.CONNECTOR_ID,
+                                        transaction_id=transaction_id)
+
+        # Step 6: StatusNotification - Available
+        timestamp = now_iso()
+        await cp.send_status_notification(
+            connector_id=C.CONNECTOR_ID,
+            status=_AVAILABLE,
+            timestamp=timestamp,
         )
-    ]
-    await cp.send_notify_event(data=event_data)
-
-    # Step 8-9: TransactionEvent Ended - EVCommunicationLost / Idle / EVDisconnected
-    ended_event = TransactionEvent(
-        event_type=TransactionEventType.ended,
-        timestamp=now_iso(),
-        trigger_reason=TriggerReasonType.ev_communication_lost,
-        seq_no=cp.next_seq_no(),
-        transaction_info={
-            'transaction_id': transaction_id,
-            'charging_state': ChargingStateType.idle,
-            'stopped_reason': StoppedReasonType.ev_disconnected,
-        },
-        meter_value=[{
-            'timestamp': now_iso(),
-            'sampled_value': [{
-                'value': 6000,
-                'context': 'Transaction.End',
+
+        # Step 6 (cont): NotifyEvent - Available
+        event_data = availability_event('Available', timestamp, C.EVSE_ID)
+        await cp.send_notify_event(data=event_data, generated_at=timestamp)
+
+        # Step 8-9: TransactionEvent Ended - EVCommunicationLost / Idle / EVDisconnected
+        timestamp = now_iso()
+        ended_event = TransactionEvent(
+            event_type=TransactionEventType.ended,
+            timestamp=timestamp,
+            trigger_reason=TriggerReasonType.ev_communication_lost,
+            seq_no=cp.next_seq_no(),
+            transaction_info={
+                'transaction_id': transaction_id,
+                'charging_state': ChargingStateType.idle,
+                'stopped_reason': StoppedReasonType.ev_disconnected,
+            },
+            meter_value=[{
+                'timestamp': timestamp,
+                'sampled_value': [{
+                    'value': 6000,
+                    'context': 'Transaction.End',
+                }],
             }],
-        }],
-        evse={
-            'id': EVSE_ID,
-            'connector_id': CONNECTOR_ID,
-        },
-    )
-    ended_response = await cp.send_transaction_event_request(ended_event)
-    assert ended_response is not None
-
-    # Tool validation: totalCost must NOT be omitted
-    assert ended_response.total_cost is not None, \
-        "TransactionEventResponse for Ended event must include totalCost (was omitted/None)"
-    logging.info(f"TransactionEventResponse totalCost={ended_response.total_cost}")
-
-    logging.info("TC_I_02 completed successfully")
-    start_task.cancel()
+            evse={
+                'id': C.EVSE_ID,
+                'connector_id': C.CONNECTOR_ID,
+            },
+        )
+        ended_response = await cp.send_transaction_event_request(ended_event)
+        assert ended_response is not None
+
+        # Tool validation: totalCost must NOT be omitted
+        assert ended_response.total_cost is not None, \
+            "TransactionEventResponse for Ended event must include totalCost (was omitted/None)"
+        logging.info(f"TransactionEventResponse totalCost={ended_response.total_cost}")
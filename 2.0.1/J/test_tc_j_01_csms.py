@@ -42,91 +42,73 @@ Configuration:
     CONFIGURED_CONNECTOR_ID   - Connector id (default 1)
 """
 import asyncio
-import os
-import sys
 from datetime import datetime, timedelta, timezone
 
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from ocpp.v201.datatypes import EventDataType, ComponentType, VariableType
+from ocpp.v201.call import MeterValues, NotifyEvent
 from ocpp.v201.enums import (
     EventTriggerEnumType as EventTriggerType,
     EventNotificationEnumType as EventNotificationType,
-    RegistrationStatusEnumType,
-    ConnectorStatusEnumType,
 )
 
-from tzi_charge_point import TziChargePoint
-from utils import get_basic_auth_headers, now_iso
+from utils import CONFIG as C, basic_auth_connection
 
-BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP']
-BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
-EVSE_ID = int(os.environ['CONFIGURED_EVSE_ID'])
-CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
 
 METER_VALUE_COUNT = 3
-CLOCK_ALIGNED_INTERVAL = int(os.environ['CLOCK_ALIGNED_METER_VALUES_INTERVAL'])
+
+_FISCAL_EVENT = {
+    'trigger': EventTriggerType.periodic,
+    'component': {'name': 'FiscalMetering'},
+    'variable': {'name': 'MeterValue'},
+    'event_notification_type': EventNotificationType.custom_monitor,
+}
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("connection", [
-    (BASIC_AUTH_CP, get_basic_auth_headers(BASIC_AUTH_CP, BASIC_AUTH_CP_PASSWORD))
+    basic_auth_connection()
 ], indirect=True)
-async def test_tc_j_01(connection):
+async def test_tc_j_01(booted_cp):
     """Clock-aligned Meter Values - No transaction ongoing (J01.FR.18).
     J01.FR.18: When CSMS receives a MeterValuesRequest CSMS SHALL respond with MeterValuesResponse. Failing to respond with MeterValuesResponse might cause the Charging Station to try the same message again.
         Precondition: When CSMS receives a MeterValuesRequest
     """
-    assert connection.open
-
-    cp = TziChargePoint(BASIC_AUTH_CP, connection)
-    start_task = asyncio.create_task(cp.start())
-
-    # Boot
-    boot_response = await cp.send_boot_notification()
-    assert boot_response.status == RegistrationStatusEnumType.accepted
-
-    await cp.send_status_notification(CONNECTOR_ID, ConnectorStatusEnumType.available)
+    cp = booted_cp
 
     # Execute for evseId=0 and configured EVSE, 3 meter value messages each
-    evse_ids = [0] if EVSE_ID == 0 else [0, EVSE_ID]
+    evse_ids = [0] if C.EVSE_ID == 0 else [0, C.EVSE_ID]
 
+    loop = asyncio.get_running_loop()
     event_counter = 0
+    responses = []
     for evse_id in evse_ids:
         base_timestamp = datetime.now(timezone.utc)
-        for i in range(METER_VALUE_COUNT):
-            tick_timestamp = (base_timestamp + timedelta(seconds=i * CLOCK_ALIGNED_INTERVAL)).isoformat()
-
-            # Step 1: MeterValuesRequest with context=Sample.Clock
-            meter_response = await cp.send_meter_values(
-                evse_id=evse_id,
-                sampled_values=[{
-                    'value': float(i * 100),
-                    'context': 'Sample.Clock',
-                }],
-                timestamp=tick_timestamp,
-            )
-            assert meter_response is not None
-
-            # Step 1 (cont): NotifyEventRequest with trigger=Periodic, component.name=FiscalMetering
+        ticks = [(base_timestamp + timedelta(seconds=i * C.CLOCK_ALIGNED_INTERVAL)).isoformat()
+                 for i in range(METER_VALUE_COUNT)]
+        start = loop.time()
+        for i, tick_timestamp in enumerate(ticks):
+            value = i * 100
+
+            # Step 1: MeterValuesRequest with context=Sample.Clock, followed by
+            # NotifyEventRequest with trigger=Periodic, component.name=FiscalMetering
             event_counter += 1
-            event_data = [
-                EventDataType(
-                    trigger=EventTriggerType.periodic,
-                    actual_value=str(i * 100),
-                    component=ComponentType(name='FiscalMetering'),
-                    variable=VariableType(name='MeterValue'),
-                    timestamp=tick_timestamp,
-                    event_id=event_counter,
-                    event_notification_type=EventNotificationType.custom_monitor,
-                )
-            ]
-            notify_response = await cp.send_notify_event(data=event_data)
-            assert notify_response is not None
+            event_data = [dict(_FISCAL_EVENT, actual_value=str(value), timestamp=tick_timestamp,
+                               event_id=event_counter)]
+            responses += await cp.send_many([
+                MeterValues(
+                    evse_id=evse_id,
+                    meter_value=[{
+                        'timestamp': tick_timestamp,
+                        'sampled_value': [{
+                            'value': float(value),
+                            'context': 'Sample.Clock',
+                        }],
+                    }],
+                ),
+                NotifyEvent(generated_at=tick_timestamp, seq_no=cp.notify_event_seq_no, event_data=event_data),
+            ], skip_schema_validation=False)
 
             if i < METER_VALUE_COUNT - 1:
-                await asyncio.sleep(CLOCK_ALIGNED_INTERVAL)
+                await asyncio.sleep(max(0, start + (i + 1) * C.CLOCK_ALIGNED_INTERVAL - loop.time()))
 
-    start_task.cancel()
+    assert all(response is not None for response in responses)
@@ -47,19 +47,12 @@ Configuration:
 """
 import asyncio
 import math
-import os
-import sys
 from datetime import datetime, timedelta, timezone
 
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from ocpp.v201.call import TransactionEvent
-from ocpp.v201.datatypes import EventDataType, ComponentType, VariableType
+from ocpp.v201.call import MeterValues, NotifyEvent, TransactionEvent
 from ocpp.v201.enums import (
-    RegistrationStatusEnumType,
-    ConnectorStatusEnumType,
     EventTriggerEnumType as EventTriggerType,
     EventNotificationEnumType as EventNotificationType,
     TransactionEventEnumType as TransactionEventType,
@@ -67,110 +60,103 @@ from ocpp.v201.enums import (
     ChargingStateEnumType as ChargingStateType,
 )
 
-from tzi_charge_point import TziChargePoint
-from utils import get_basic_auth_headers, generate_transaction_id, now_iso
+from utils import CONFIG as C, basic_auth_connection, generate_transaction_id
 from reusable_states.authorized import authorized
 from reusable_states.energy_transfer_started import energy_transfer_started
 
-BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP']
-BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
-VALID_ID_TOKEN = os.environ['VALID_ID_TOKEN']
-VALID_ID_TOKEN_TYPE = os.environ['VALID_ID_TOKEN_TYPE']
-EVSE_ID = int(os.environ['CONFIGURED_EVSE_ID'])
-CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
-TRANSACTION_DURATION = int(os.environ['TRANSACTION_DURATION'])
 
-CLOCK_ALIGNED_INTERVAL = int(os.environ['CLOCK_ALIGNED_METER_VALUES_INTERVAL'])
+_FISCAL_EVENT = {
+    'trigger': EventTriggerType.periodic,
+    'component': {'name': 'FiscalMetering'},
+    'variable': {'name': 'MeterValue'},
+    'event_notification_type': EventNotificationType.custom_monitor,
+}
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("connection", [
-    (BASIC_AUTH_CP, get_basic_auth_headers(BASIC_AUTH_CP, BASIC_AUTH_CP_PASSWORD))
+    basic_auth_connection()
 ], indirect=True)
-async def test_tc_j_02(connection):
+async def test_tc_j_02(booted_cp):
     """Clock-aligned Meter Values - Transaction ongoing (J01.FR.18).
     J01.FR.18: When CSMS receives a MeterValuesRequest CSMS SHALL respond with MeterValuesResponse. Failing to respond with MeterValuesResponse might cause the Charging Station to try the same message again.
         Precondition: When CSMS receives a MeterValuesRequest
     """
-    assert connection.open
-
-    cp = TziChargePoint(BASIC_AUTH_CP, connection)
-    start_task = asyncio.create_task(cp.start())
+    cp = booted_cp
 
     transaction_id = generate_transaction_id()
 
-    # Boot
-    boot_response = await cp.send_boot_notification()
-    assert boot_response.status == RegistrationStatusEnumType.accepted
-
-    await cp.send_status_notification(CONNECTOR_ID, ConnectorStatusEnumType.available)
-
     # Before: EnergyTransferStarted
-    await authorized(cp, id_token_id=VALID_ID_TOKEN, id_token_type=VALID_ID_TOKEN_TYPE,
-                     transaction_id=transaction_id, evse_id=EVSE_ID, connector_id=CONNECTOR_ID)
-    await energy_transfer_started(cp, evse_id=EVSE_ID, connector_id=CONNECTOR_ID,
+    await authorized(cp, id_token_id=C.VALID_ID_TOKEN, id_token_type=C.VALID_ID_TOKEN_TYPE,
+                     transaction_id=transaction_id, evse_id=C.EVSE_ID, connector_id=C.CONNECTOR_ID)
+    await energy_transfer_started(cp, evse_id=C.EVSE_ID, connector_id=C.CONNECTOR_ID,
                                   transaction_id=transaction_id)
 
-    iterations = max(1, math.ceil(TRANSACTION_DURATION / CLOCK_ALIGNED_INTERVAL))
+    iterations = max(1, math.ceil(C.TRANSACTION_DURATION / C.CLOCK_ALIGNED_INTERVAL))
     base_timestamp = datetime.now(timezone.utc)
+    ticks = [(base_timestamp + timedelta(seconds=i * C.CLOCK_ALIGNED_INTERVAL)).isoformat()
+             for i in range(iterations)]
+    loop = asyncio.get_running_loop()
+    start = loop.time()
 
     # Step 1-4: Clock-aligned periodic messages during ongoing transaction.
-    for i in range(iterations):
-        tick_timestamp = (base_timestamp + timedelta(seconds=i * CLOCK_ALIGNED_INTERVAL)).isoformat()
-
-        # Step 1-2: MeterValues for evseId=0 and idle EVSEs (clock-aligned, Sample.Clock)
-        evse_id = 0
-        meter_response = await cp.send_meter_values(
-            evse_id=evse_id,
-            sampled_values=[{
-                'value': float((i + 1) * 100),
-                'context': 'Sample.Clock',
-            }],
-            timestamp=tick_timestamp,
-        )
-        assert meter_response is not None
-
-        # NotifyEventRequest for FiscalMetering
-        event_data = [
-            EventDataType(
-                trigger=EventTriggerType.periodic,
-                actual_value=str((i + 1) * 100),
-                component=ComponentType(name='FiscalMetering'),
-                variable=VariableType(name='MeterValue'),
-                timestamp=tick_timestamp,
-                event_id=i + 1,
-                event_notification_type=EventNotificationType.custom_monitor,
-            )
-        ]
-        notify_response = await cp.send_notify_event(data=event_data)
-        assert notify_response is not None
-
-        # Step 3-4: TransactionEventRequest with triggerReason=MeterValueClock for the active EVSE
-        meter_clock_event = TransactionEvent(
-            event_type=TransactionEventType.updated,
-            timestamp=tick_timestamp,
-            trigger_reason=TriggerReasonType.meter_value_clock,
-            seq_no=cp.next_seq_no(),
-            transaction_info={
-                'transaction_id': transaction_id,
-                'charging_state': ChargingStateType.charging,
-            },
-            evse={
-                'id': EVSE_ID,
-                'connector_id': CONNECTOR_ID,
-            },
-            meter_value=[{
-                'timestamp': tick_timestamp,
-                'sampled_value': [{
-                    'value': float((i + 1) * 100),
-                    'context': 'Sample.Clock',
+    pending = []
+    try:
+        for i, tick_timestamp in enumerate(ticks):
+            value = (i + 1) * 100
+
+            # Step 1-2: MeterValues for evseId=0 and idle EVSEs (clock-aligned, Sample.Clock)
+            meter_values = MeterValues(
+                evse_id=0,
+                meter_value=[{
+                    'timestamp': tick_timestamp,
+                    'sampled_value': [{
+                        'value': float(value),
+                        'context': 'Sample.Clock',
+                    }],
                 }],
-            }],
-        )
-        tx_response = await cp.send_transaction_event_request(meter_clock_event)
-        assert tx_response is not None
+            )
+
+            # NotifyEventRequest for FiscalMetering
+            event_data = [dict(_FISCAL_EVENT, actual_value=str(value), timestamp=tick_timestamp,
+                               event_id=i + 1)]
+            notify_event = NotifyEvent(generated_at=tick_timestamp, seq_no=cp.notify_event_seq_no,
+                                       event_data=event_data)
 
-        if i < iterations - 1:
-            await asyncio.sleep(CLOCK_ALIGNED_INTERVAL)
+            # Step 3-4: TransactionEventRequest with triggerReason=MeterValueClock for the active EVSE
+            meter_clock_event = TransactionEvent(
+                event_type=TransactionEventType.updated,
+                timestamp=tick_timestamp,
+                trigger_reason=TriggerReasonType.meter_value_clock,
+                seq_no=cp.next_seq_no(),
+                transaction_info={
+                    'transaction_id': transaction_id,
+                    'charging_state': ChargingStateType.charging,
+                },
+                evse={
+                    'id': C.EVSE_ID,
+                    'connector_id': C.CONNECTOR_ID,
+                },
+                meter_value=[{
+                    'timestamp': tick_timestamp,
+                    'sampled_value': [{
+                        'value': float(value),
+                        'context': 'Sample.Clock',
+                    }],
+                }],
+            )
 
-    start_task.cancel()
+            # Don't hold the next tick back on this tick's responses. Calls are
+            # serialized in creation order, so seqNo order on the wire is kept.
+            pending.append(asyncio.create_task(
+                cp.send_many([meter_values, notify_event, meter_clock_event], skip_schema_validation=False)
+            ))
+
+            if i < iterations - 1:
+                await asyncio.sleep(max(0, start + (i + 1) * C.CLOCK_ALIGNED_INTERVAL - loop.time()))
+
+        responses = [response for batch in await asyncio.gather(*pending) for response in batch]
+    finally:
+        # A failed tick must not leave later batches running past the test.
+        for task in pending:
+            task.cancel()
+    assert all(response is not None for response in responses)
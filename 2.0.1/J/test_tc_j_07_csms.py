@@ -32,78 +32,49 @@ Configuration:
     CONFIGURED_CONNECTOR_ID   - Connector id (default 1)
 """
 import asyncio
-import os
-import sys
 
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from ocpp.v201.call import TransactionEvent
-from ocpp.v201.datatypes import EventDataType, ComponentType, VariableType
 from ocpp.v201.enums import (
-    RegistrationStatusEnumType,
     ConnectorStatusEnumType,
-    EventTriggerEnumType as EventTriggerType,
-    EventNotificationEnumType as EventNotificationType,
     TransactionEventEnumType as TransactionEventType,
     TriggerReasonEnumType as TriggerReasonType,
     ChargingStateEnumType as ChargingStateType,
 )
 
-from tzi_charge_point import TziChargePoint
-from utils import get_basic_auth_headers, generate_transaction_id, now_iso
-
-BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP']
-BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
-EVSE_ID = int(os.environ['CONFIGURED_EVSE_ID'])
-CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
+from utils import CONFIG as C, availability_event, basic_auth_connection, generate_transaction_id, now_iso
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("connection", [
-    (BASIC_AUTH_CP, get_basic_auth_headers(BASIC_AUTH_CP, BASIC_AUTH_CP_PASSWORD))
+    basic_auth_connection()
 ], indirect=True)
-async def test_tc_j_07(connection):
+async def test_tc_j_07(booted_cp):
     """Sampled Meter Values - EventType Started - EVSE known (J02.FR.19).
     J02.FR.19: When CSMS receives a TransactionEventRequest CSMS SHALL respond with TransactionEventResponse. Failing to respond with TransactionEventRespon se might cause the Charging Station to try the same message
         Precondition: When CSMS receives a TransactionEventRequest
     """
-    assert connection.open
-
-    cp = TziChargePoint(BASIC_AUTH_CP, connection)
-    start_task = asyncio.create_task(cp.start())
+    cp = booted_cp
 
     transaction_id = generate_transaction_id()
 
-    # Boot
-    boot_response = await cp.send_boot_notification()
-    assert boot_response.status == RegistrationStatusEnumType.accepted
-
-    await cp.send_status_notification(CONNECTOR_ID, ConnectorStatusEnumType.available)
-
     # Step 1: Execute Reusable State EVConnectedPreSession (inline with MeterValue)
-    # StatusNotification - Occupied
-    await cp.send_status_notification(connector_id=CONNECTOR_ID, status=ConnectorStatusEnumType.occupied)
-
-    # NotifyEvent - Occupied
-    event_data = [
-        EventDataType(
-            trigger=EventTriggerType.delta,
-            actual_value='Occupied',
-            component=ComponentType(name='Connector'),
-            variable=VariableType(name='AvailabilityState'),
-            timestamp=now_iso(),
-            event_id=EVSE_ID,
-            event_notification_type=EventNotificationType.custom_monitor,
-        )
-    ]
-    await cp.send_notify_event(data=event_data)
+    # StatusNotification and NotifyEvent - Occupied
+    timestamp = now_iso()
+    event_data = availability_event('Occupied', timestamp, C.EVSE_ID)
+    await asyncio.gather(
+        cp.send_status_notification(
+            connector_id=C.CONNECTOR_ID,
+            status=ConnectorStatusEnumType.occupied,
+            timestamp=timestamp,
+        ),
+        cp.send_notify_event(data=event_data, generated_at=timestamp),
+    )
 
     # TransactionEvent Started with MeterValue containing Transaction.Begin
     started_event = TransactionEvent(
         event_type=TransactionEventType.started,
-        timestamp=now_iso(),
+        timestamp=timestamp,
         trigger_reason=TriggerReasonType.cable_plugged_in,
         seq_no=cp.next_seq_no(),
         transaction_info={
@@ -111,11 +82,11 @@ async def test_tc_j_07(connection):
             'charging_state': ChargingStateType.ev_connected,
         },
         evse={
-            'id': EVSE_ID,
-            'connector_id': CONNECTOR_ID,
+            'id': C.EVSE_ID,
+            'connector_id': C.CONNECTOR_ID,
         },
         meter_value=[{
-            'timestamp': now_iso(),
+            'timestamp': timestamp,
             'sampled_value': [{
                 'value': 0.0,
                 'context': 'Transaction.Begin',
@@ -124,5 +95,3 @@ async def test_tc_j_07(connection):
     )
     started_response = await cp.send_transaction_event_request(started_event)
     assert started_response is not None
-
-    start_task.cancel()
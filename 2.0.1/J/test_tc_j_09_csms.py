@@ -72,7 +72,6 @@ SAMPLED_METER_VALUES_INTERVAL = int(os.environ['SAMPLED_METER_VALUES_INTERVAL'])
 METER_VALUE_COUNT = 3
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("connection", [
     (BASIC_AUTH_CP, get_basic_auth_headers(BASIC_AUTH_CP, BASIC_AUTH_CP_PASSWORD))
 ], indirect=True)
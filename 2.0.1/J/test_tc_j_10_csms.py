@@ -37,95 +37,74 @@ Configuration:
     CONFIGURED_EVSE_ID        - EVSE id (default 1)
     CONFIGURED_CONNECTOR_ID   - Connector id (default 1)
     TRANSACTION_DURATION      - Duration of the transaction in seconds (default 5)
+    TX_VIRTUAL_CLOCK          - Advance timestamps by TRANSACTION_DURATION instead of sleeping (default true)
 """
 import asyncio
-import os
-import sys
 from datetime import datetime, timedelta, timezone
 
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from ocpp.v201.call import TransactionEvent
-from ocpp.v201.datatypes import EventDataType, ComponentType, VariableType
 from ocpp.v201.enums import (
-    RegistrationStatusEnumType,
     ConnectorStatusEnumType,
-    EventTriggerEnumType as EventTriggerType,
-    EventNotificationEnumType as EventNotificationType,
     TransactionEventEnumType as TransactionEventType,
     TriggerReasonEnumType as TriggerReasonType,
     ReasonEnumType as StoppedReasonType,
     ChargingStateEnumType as ChargingStateType,
 )
 
-from tzi_charge_point import TziChargePoint
-from utils import get_basic_auth_headers, generate_transaction_id, now_iso
+from utils import CONFIG as C, availability_event, basic_auth_connection, generate_transaction_id
 from reusable_states.authorized import authorized
 from reusable_states.energy_transfer_started import energy_transfer_started
 
-BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP']
-BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
-VALID_ID_TOKEN = os.environ['VALID_ID_TOKEN']
-VALID_ID_TOKEN_TYPE = os.environ['VALID_ID_TOKEN_TYPE']
-EVSE_ID = int(os.environ['CONFIGURED_EVSE_ID'])
-CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
-TRANSACTION_DURATION = int(os.environ['TRANSACTION_DURATION'])
-TX_ENDED_METER_VALUES_INTERVAL = int(os.environ['TX_ENDED_METER_VALUES_INTERVAL'])
+# Ended meter values; only the timestamps differ per run.
+_SAMPLED_VALUE_FIRST = [{'value': 500.0, 'context': 'Sample.Periodic'}]
+_SAMPLED_VALUE_LAST = [
+    {'value': 510.0, 'context': 'Sample.Periodic'},
+    {'value': 510.0, 'context': 'Transaction.End'},
+]
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("connection", [
-    (BASIC_AUTH_CP, get_basic_auth_headers(BASIC_AUTH_CP, BASIC_AUTH_CP_PASSWORD))
+    basic_auth_connection()
 ], indirect=True)
-async def test_tc_j_10(connection):
+async def test_tc_j_10(booted_cp):
     """Sampled Meter Values - EventType Ended (J02.FR.19).
     J02.FR.19: When CSMS receives a TransactionEventRequest CSMS SHALL respond with TransactionEventResponse. Failing to respond with TransactionEventRespon se might cause the Charging Station to try the same message
         Precondition: When CSMS receives a TransactionEventRequest
     """
-    assert connection.open
-
-    cp = TziChargePoint(BASIC_AUTH_CP, connection)
-    start_task = asyncio.create_task(cp.start())
+    cp = booted_cp
 
     transaction_id = generate_transaction_id()
 
-    # Boot
-    boot_response = await cp.send_boot_notification()
-    assert boot_response.status == RegistrationStatusEnumType.accepted
-
-    await cp.send_status_notification(CONNECTOR_ID, ConnectorStatusEnumType.available)
-
     # Before: EnergyTransferStarted
-    await authorized(cp, id_token_id=VALID_ID_TOKEN, id_token_type=VALID_ID_TOKEN_TYPE,
-                     transaction_id=transaction_id, evse_id=EVSE_ID, connector_id=CONNECTOR_ID)
-    await energy_transfer_started(cp, evse_id=EVSE_ID, connector_id=CONNECTOR_ID,
+    await authorized(cp, id_token_id=C.VALID_ID_TOKEN, id_token_type=C.VALID_ID_TOKEN_TYPE,
+                     transaction_id=transaction_id, evse_id=C.EVSE_ID, connector_id=C.CONNECTOR_ID)
+    await energy_transfer_started(cp, evse_id=C.EVSE_ID, connector_id=C.CONNECTOR_ID,
                                   transaction_id=transaction_id)
 
-    # Wait for configured transaction duration
-    await asyncio.sleep(TRANSACTION_DURATION)
+    # Let the configured transaction duration pass, either on the wall clock
+    # or only in the timestamps reported from here on.
+    if C.TX_VIRTUAL_CLOCK:
+        tx_end_base = datetime.now(timezone.utc) + timedelta(seconds=C.TRANSACTION_DURATION)
+    else:
+        await asyncio.sleep(C.TRANSACTION_DURATION)
+        tx_end_base = datetime.now(timezone.utc)
+    tx_end_iso = tx_end_base.isoformat()
+    tx_end_second = (tx_end_base + timedelta(seconds=C.TX_ENDED_METER_VALUES_INTERVAL)).isoformat()
 
     # Step 1: Execute Reusable State EVDisconnected (inline with meter values)
-    # StatusNotification - Available
-    await cp.send_status_notification(connector_id=CONNECTOR_ID, status=ConnectorStatusEnumType.available, evse_id=EVSE_ID)
-
-    # NotifyEvent - Available
-    event_data = [
-        EventDataType(
-            trigger=EventTriggerType.delta,
-            actual_value='Available',
-            component=ComponentType(name='Connector'),
-            variable=VariableType(name='AvailabilityState'),
-            timestamp=now_iso(),
-            event_id=EVSE_ID,
-            event_notification_type=EventNotificationType.custom_monitor,
-        )
-    ]
-    await cp.send_notify_event(data=event_data)
-
-    tx_end_base = datetime.now(timezone.utc)
-    tx_end_second = (tx_end_base + timedelta(seconds=TX_ENDED_METER_VALUES_INTERVAL)).isoformat()
+    # StatusNotification and NotifyEvent - Available
+    event_data = availability_event('Available', tx_end_iso, C.EVSE_ID)
+    await asyncio.gather(
+        cp.send_status_notification(
+            connector_id=C.CONNECTOR_ID,
+            status=ConnectorStatusEnumType.available,
+            evse_id=C.EVSE_ID,
+            timestamp=tx_end_iso,
+        ),
+        cp.send_notify_event(data=event_data, generated_at=tx_end_iso),
+    )
 
     # TransactionEvent Ended with sampled MeterValues and final Transaction.End context
     end_event = TransactionEvent(
@@ -139,35 +118,13 @@ async def test_tc_j_10(connection):
             'stopped_reason': StoppedReasonType.ev_disconnected,
         },
         evse={
-            'id': EVSE_ID,
-            'connector_id': CONNECTOR_ID,
+            'id': C.EVSE_ID,
+            'connector_id': C.CONNECTOR_ID,
         },
         meter_value=[
-            {
-                'timestamp': tx_end_base.isoformat(),
-                'sampled_value': [
-                    {
-                        'value': 500.0,
-                        'context': 'Sample.Periodic',
-                    },
-                ],
-            },
-            {
-                'timestamp': tx_end_second,
-                'sampled_value': [
-                    {
-                        'value': 510.0,
-                        'context': 'Sample.Periodic',
-                    },
-                    {
-                        'value': 510.0,
-                        'context': 'Transaction.End',
-                    },
-                ],
-            },
+            {'timestamp': tx_end_iso, 'sampled_value': _SAMPLED_VALUE_FIRST},
+            {'timestamp': tx_end_second, 'sampled_value': _SAMPLED_VALUE_LAST},
         ],
     )
     end_response = await cp.send_transaction_event_request(end_event)
     assert end_response is not None
-
-    start_task.cancel()
@@ -40,162 +40,96 @@ Tool validations:
       - chargingProfile.chargingSchedule.chargingSchedulePeriod.numberPhases <Configured numberPhases>
         or <omit> where <Configured numberPhases> 3
 """
-import asyncio
-import logging
-import os
-import sys
-import time
-
 import pytest
-import websockets
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from ocpp.routing import on
-from ocpp.v201 import call_result
 from ocpp.v201.enums import (
-    Action,
-    RegistrationStatusEnumType,
-    ConnectorStatusEnumType,
-    ChargingProfileStatusEnumType,
     ChargingProfilePurposeEnumType,
     ChargingProfileKindEnumType,
 )
 
-from tzi_charge_point import TziChargePoint
-from utils import get_basic_auth_headers, now_iso
-
-logging.basicConfig(level=logging.INFO)
-
-CSMS_ADDRESS = os.environ['CSMS_ADDRESS']
-BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP']
-BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
-EVSE_ID = int(os.environ['CONFIGURED_EVSE_ID'])
-CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
-CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
-CONFIGURED_NUMBER_PHASES = int(os.environ['CONFIGURED_NUMBER_PHASES'])
-
-
-class SmartChargingMockCP(TziChargePoint):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._received_set_charging_profile = asyncio.Event()
-        self._set_charging_profile_data = None
-        self._set_charging_profile_response_status = ChargingProfileStatusEnumType.accepted
-
-    @on(Action.set_charging_profile)
-    async def on_set_charging_profile(self, evse_id, charging_profile, **kwargs):
-        logging.info(f"Received SetChargingProfileRequest: evse_id={evse_id}, profile={charging_profile}")
-        self._set_charging_profile_data = {
-            'evse_id': evse_id,
-            'charging_profile': charging_profile,
-        }
-        self._received_set_charging_profile.set()
-        return call_result.SetChargingProfile(
-            status=self._set_charging_profile_response_status
-        )
-
-
-@pytest.mark.asyncio
-async def test_tc_k_01():
-    """Set Charging Profile - TxDefaultProfile - Specific EVSE."""
-    cp_id = BASIC_AUTH_CP
-    uri = f'{CSMS_ADDRESS}/{cp_id}'
-    headers = get_basic_auth_headers(cp_id, BASIC_AUTH_CP_PASSWORD)
-
-    ws = await websockets.connect(
-        uri=uri,
-        subprotocols=['ocpp2.0.1'],
-        extra_headers=headers,
-    )
-    time.sleep(0.5)
+from utils import CONFIG as C, basic_auth_connection, normalize_charging_profile
 
-    cp = SmartChargingMockCP(cp_id, ws)
-    start_task = asyncio.create_task(cp.start())
+_VALID_PURPOSES = frozenset({ChargingProfilePurposeEnumType.tx_default_profile})
+_VALID_KINDS = frozenset({ChargingProfileKindEnumType.absolute})
+_VALID_LIMITS = frozenset({6.0, 6000.0})
 
-    # Boot and establish session
-    boot_response = await cp.send_boot_notification()
-    assert boot_response.status == RegistrationStatusEnumType.accepted
 
-    await cp.send_status_notification(CONNECTOR_ID, ConnectorStatusEnumType.available)
+@pytest.mark.parametrize("connection", [
+    basic_auth_connection()
+], indirect=True)
+async def test_tc_k_01(booted_cp):
+    """Set Charging Profile - TxDefaultProfile - Specific EVSE."""
+    cp = booted_cp
 
     # Step 1-2: Wait for CSMS to send SetChargingProfileRequest
-    await asyncio.wait_for(
-        cp._received_set_charging_profile.wait(),
-        timeout=CSMS_ACTION_TIMEOUT,
-    )
+    await cp.wait_for_request(cp._received_set_charging_profile, C.CSMS_ACTION_TIMEOUT)
+    req_data = cp._set_charging_profile_data
 
     # Validate Step 1: SetChargingProfileRequest content
-    assert cp._set_charging_profile_data is not None
-    req_data = cp._set_charging_profile_data
-    profile = req_data['charging_profile']
+    profile = normalize_charging_profile(req_data['charging_profile'])
 
     # evseId must be configured evseId
-    assert req_data['evse_id'] == EVSE_ID, \
-        f"Expected evseId={EVSE_ID}, got {req_data['evse_id']}"
+    assert req_data['evse_id'] == C.EVSE_ID, \
+        f"Expected evseId={C.EVSE_ID}, got {req_data['evse_id']}"
 
     # chargingProfile.chargingProfilePurpose must be TxDefaultProfile
-    purpose = profile.get('charging_profile_purpose') or profile.get('chargingProfilePurpose')
-    assert purpose in ('TxDefaultProfile', ChargingProfilePurposeEnumType.tx_default_profile), \
+    purpose = profile.charging_profile_purpose
+    assert purpose in _VALID_PURPOSES, \
         f"Expected purpose=TxDefaultProfile, got {purpose}"
 
     # chargingProfile.chargingProfileKind must be Absolute
-    kind = profile.get('charging_profile_kind') or profile.get('chargingProfileKind')
-    assert kind in ('Absolute', ChargingProfileKindEnumType.absolute), \
+    kind = profile.charging_profile_kind
+    assert kind in _VALID_KINDS, \
         f"Expected kind=Absolute, got {kind}"
 
     # chargingProfile.stackLevel must be present
-    stack_level = profile.get('stack_level') or profile.get('stackLevel')
+    stack_level = profile.stack_level
     assert stack_level is not None, "stackLevel must be present"
 
     # chargingProfile.validFrom must not be omitted (approximately now)
-    valid_from = profile.get('valid_from') or profile.get('validFrom')
+    valid_from = profile.valid_from
     assert valid_from is not None, "validFrom must be present (now)"
 
     # chargingProfile.validTo must not be omitted
-    valid_to = profile.get('valid_to') or profile.get('validTo')
+    valid_to = profile.valid_to
     assert valid_to is not None, "validTo must be present"
 
     # chargingSchedule validations
-    schedules = profile.get('charging_schedule') or profile.get('chargingSchedule')
+    schedules = profile.charging_schedule
     assert schedules is not None and len(schedules) > 0, "chargingSchedule must be present"
-    schedule = schedules[0] if isinstance(schedules, list) else schedules
+    schedule = schedules[0]
 
     # startSchedule must be approximately now
-    start_schedule = schedule.get('start_schedule') or schedule.get('startSchedule')
+    start_schedule = schedule.start_schedule
     assert start_schedule is not None, "startSchedule must be present"
 
     # chargingRateUnit must be present
-    rate_unit = schedule.get('charging_rate_unit') or schedule.get('chargingRateUnit')
+    rate_unit = schedule.charging_rate_unit
     assert rate_unit is not None, "chargingRateUnit must be present"
 
     # duration must be present
-    duration = schedule.get('duration')
+    duration = schedule.duration
     assert duration is not None, "duration must be present"
 
     # chargingSchedulePeriod validations
-    periods = schedule.get('charging_schedule_period') or schedule.get('chargingSchedulePeriod')
+    periods = schedule.charging_schedule_period
     assert periods is not None and len(periods) > 0, "chargingSchedulePeriod must be present"
     period = periods[0]
 
     # startPeriod must be 0
-    start_period = period.get('start_period') if period.get('start_period') is not None else period.get('startPeriod')
+    start_period = period.start_period
     assert start_period == 0, f"Expected startPeriod=0, got {start_period}"
 
     # limit must be 6.0 or 6000.0
-    limit = period.get('limit')
-    assert limit in (6.0, 6000.0), \
+    limit = period.limit
+    assert limit in _VALID_LIMITS, \
         f"Expected limit=6.0 or 6000.0, got {limit}"
 
     # numberPhases validation
-    number_phases = period.get('number_phases') if period.get('number_phases') is not None else period.get('numberPhases')
-    if CONFIGURED_NUMBER_PHASES != 3:
-        assert number_phases == CONFIGURED_NUMBER_PHASES, \
-            f"Expected numberPhases={CONFIGURED_NUMBER_PHASES}, got {number_phases}"
+    number_phases = period.number_phases
+    if C.NUMBER_PHASES != 3:
+        assert number_phases == C.NUMBER_PHASES, \
+            f"Expected numberPhases={C.NUMBER_PHASES}, got {number_phases}"
     else:
         assert number_phases is None or number_phases == 3, \
             f"Expected numberPhases=3 or omitted, got {number_phases}"
-
-    logging.info("TC_K_01 completed successfully")
-    start_task.cancel()
-    await ws.close()
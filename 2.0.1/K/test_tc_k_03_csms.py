@@ -37,156 +37,93 @@ Tool validations:
       - chargingProfile.validTo <Not omitted> AND
       - chargingProfile.chargingSchedule.startSchedule <Not omitted>
 """
-import asyncio
-import logging
-import os
-import sys
-import time
-
 import pytest
-import websockets
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from ocpp.routing import on
-from ocpp.v201 import call_result
 from ocpp.v201.enums import (
-    Action,
-    RegistrationStatusEnumType,
-    ConnectorStatusEnumType,
-    ChargingProfileStatusEnumType,
     ChargingProfilePurposeEnumType,
     ChargingProfileKindEnumType,
 )
 
-from tzi_charge_point import TziChargePoint
-from utils import get_basic_auth_headers, now_iso
-
-logging.basicConfig(level=logging.INFO)
-
-CSMS_ADDRESS = os.environ['CSMS_ADDRESS']
-BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP']
-BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
-CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
-CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
-CONFIGURED_NUMBER_PHASES = int(os.environ['CONFIGURED_NUMBER_PHASES'])
-
-
-class SmartChargingMockCP(TziChargePoint):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._received_set_charging_profile = asyncio.Event()
-        self._set_charging_profile_data = None
-        self._set_charging_profile_response_status = ChargingProfileStatusEnumType.accepted
-
-    @on(Action.set_charging_profile)
-    async def on_set_charging_profile(self, evse_id, charging_profile, **kwargs):
-        logging.info(f"Received SetChargingProfileRequest: evse_id={evse_id}, profile={charging_profile}")
-        self._set_charging_profile_data = {
-            'evse_id': evse_id,
-            'charging_profile': charging_profile,
-        }
-        self._received_set_charging_profile.set()
-        return call_result.SetChargingProfile(
-            status=self._set_charging_profile_response_status
-        )
-
-
-@pytest.mark.asyncio
-async def test_tc_k_03():
-    """Set Charging Profile - ChargingStationMaxProfile."""
-    cp_id = BASIC_AUTH_CP
-    uri = f'{CSMS_ADDRESS}/{cp_id}'
-    headers = get_basic_auth_headers(cp_id, BASIC_AUTH_CP_PASSWORD)
-
-    ws = await websockets.connect(
-        uri=uri,
-        subprotocols=['ocpp2.0.1'],
-        extra_headers=headers,
-    )
-    time.sleep(0.5)
+from utils import CONFIG as C, basic_auth_connection, normalize_charging_profile
 
-    cp = SmartChargingMockCP(cp_id, ws)
-    start_task = asyncio.create_task(cp.start())
+_VALID_PURPOSES = frozenset({ChargingProfilePurposeEnumType.charging_station_max_profile})
+_VALID_KINDS = frozenset({ChargingProfileKindEnumType.absolute})
+_VALID_LIMITS = frozenset({8.0, 8000.0})
 
-    boot_response = await cp.send_boot_notification()
-    assert boot_response.status == RegistrationStatusEnumType.accepted
 
-    await cp.send_status_notification(CONNECTOR_ID, ConnectorStatusEnumType.available)
+@pytest.mark.parametrize("connection", [
+    basic_auth_connection()
+], indirect=True)
+async def test_tc_k_03(booted_cp):
+    """Set Charging Profile - ChargingStationMaxProfile."""
+    cp = booted_cp
 
     # Step 1-2: Wait for CSMS to send SetChargingProfileRequest
-    await asyncio.wait_for(
-        cp._received_set_charging_profile.wait(),
-        timeout=CSMS_ACTION_TIMEOUT,
-    )
+    await cp.wait_for_request(cp._received_set_charging_profile, C.CSMS_ACTION_TIMEOUT)
 
     assert cp._set_charging_profile_data is not None
     req_data = cp._set_charging_profile_data
-    profile = req_data['charging_profile']
+    profile = normalize_charging_profile(req_data['charging_profile'])
 
     # evseId must be 0
     assert req_data['evse_id'] == 0, \
         f"Expected evseId=0, got {req_data['evse_id']}"
 
     # chargingProfilePurpose must be ChargingStationMaxProfile
-    purpose = profile.get('charging_profile_purpose') or profile.get('chargingProfilePurpose')
-    assert purpose in ('ChargingStationMaxProfile', ChargingProfilePurposeEnumType.charging_station_max_profile), \
+    purpose = profile.charging_profile_purpose
+    assert purpose in _VALID_PURPOSES, \
         f"Expected purpose=ChargingStationMaxProfile, got {purpose}"
 
     # chargingProfileKind must be Absolute
-    kind = profile.get('charging_profile_kind') or profile.get('chargingProfileKind')
-    assert kind in ('Absolute', ChargingProfileKindEnumType.absolute), \
+    kind = profile.charging_profile_kind
+    assert kind in _VALID_KINDS, \
         f"Expected kind=Absolute, got {kind}"
 
     # stackLevel must be present
-    stack_level = profile.get('stack_level') or profile.get('stackLevel')
+    stack_level = profile.stack_level
     assert stack_level is not None, "stackLevel must be present"
 
     # validFrom must NOT be omitted
-    valid_from = profile.get('valid_from') or profile.get('validFrom')
+    valid_from = profile.valid_from
     assert valid_from is not None, "validFrom must not be omitted"
 
     # validTo must NOT be omitted
-    valid_to = profile.get('valid_to') or profile.get('validTo')
+    valid_to = profile.valid_to
     assert valid_to is not None, "validTo must not be omitted"
 
     # chargingSchedule validations
-    schedules = profile.get('charging_schedule') or profile.get('chargingSchedule')
+    schedules = profile.charging_schedule
     assert schedules is not None and len(schedules) > 0
-    schedule = schedules[0] if isinstance(schedules, list) else schedules
+    schedule = schedules[0]
 
     # startSchedule must NOT be omitted
-    start_schedule = schedule.get('start_schedule') or schedule.get('startSchedule')
+    start_schedule = schedule.start_schedule
     assert start_schedule is not None, "startSchedule must not be omitted"
 
     # chargingRateUnit must be present
-    rate_unit = schedule.get('charging_rate_unit') or schedule.get('chargingRateUnit')
+    rate_unit = schedule.charging_rate_unit
     assert rate_unit is not None, "chargingRateUnit must be present"
 
     # duration must be present
-    duration = schedule.get('duration')
+    duration = schedule.duration
     assert duration is not None, "duration must be present"
 
     # chargingSchedulePeriod
-    periods = schedule.get('charging_schedule_period') or schedule.get('chargingSchedulePeriod')
+    periods = schedule.charging_schedule_period
     assert periods is not None and len(periods) > 0
     period = periods[0]
 
-    start_period = period.get('start_period') if period.get('start_period') is not None else period.get('startPeriod')
+    start_period = period.start_period
     assert start_period == 0, f"Expected startPeriod=0, got {start_period}"
 
-    limit = period.get('limit')
-    assert limit in (8.0, 8000.0), f"Expected limit=8.0 or 8000.0, got {limit}"
+    limit = period.limit
+    assert limit in _VALID_LIMITS, f"Expected limit=8.0 or 8000.0, got {limit}"
 
     # numberPhases validation
-    number_phases = period.get('number_phases') if period.get('number_phases') is not None else period.get('numberPhases')
-    if CONFIGURED_NUMBER_PHASES != 3:
-        assert number_phases == CONFIGURED_NUMBER_PHASES, \
-            f"Expected numberPhases={CONFIGURED_NUMBER_PHASES}, got {number_phases}"
+    number_phases = period.number_phases
+    if C.NUMBER_PHASES != 3:
+        assert number_phases == C.NUMBER_PHASES, \
+            f"Expected numberPhases={C.NUMBER_PHASES}, got {number_phases}"
     else:
         assert number_phases is None or number_phases == 3, \
             f"Expected numberPhases=3 or omitted, got {number_phases}"
-
-    logging.info("TC_K_03 completed successfully")
-    start_task.cancel()
-    await ws.close()
@@ -34,170 +34,136 @@ Tool validations:
 """
 import asyncio
 import logging
-import os
-import sys
-import time
 
 import pytest
-import websockets
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from ocpp.routing import on
 from ocpp.v201 import call_result
 from ocpp.v201.enums import (
     Action,
-    RegistrationStatusEnumType,
-    ConnectorStatusEnumType,
     ChargingProfileStatusEnumType,
     ChargingProfilePurposeEnumType,
     ChargingProfileKindEnumType,
 )
 
 from tzi_charge_point import TziChargePoint
-from utils import get_basic_auth_headers, now_iso
-
-logging.basicConfig(level=logging.INFO)
+from utils import CONFIG as C, basic_auth_connection, normalize_charging_profile
 
-CSMS_ADDRESS = os.environ['CSMS_ADDRESS']
-BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP']
-BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
-CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
-CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
+_VALID_FIRST_LIMITS = frozenset({8.0, 8000.0})
+_VALID_SECOND_LIMITS = frozenset({6.0, 6000.0})
+_VALID_PURPOSES = frozenset({
+    ChargingProfilePurposeEnumType.tx_default_profile,
+    ChargingProfilePurposeEnumType.charging_station_max_profile,
+})
+_VALID_TX_DEFAULT_KINDS = frozenset({ChargingProfileKindEnumType.absolute, ChargingProfileKindEnumType.recurring})
 
 
 class SmartChargingMockCP(TziChargePoint):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._set_charging_profile_count = 0
-        self._set_charging_profile_requests = []
-        self._all_profiles_received = asyncio.Event()
+        self._set_charging_profile_queue = asyncio.Queue()
 
     @on(Action.set_charging_profile)
     async def on_set_charging_profile(self, evse_id, charging_profile, **kwargs):
-        logging.info(f"Received SetChargingProfileRequest #{self._set_charging_profile_count + 1}: "
-                     f"evse_id={evse_id}, profile={charging_profile}")
-        self._set_charging_profile_requests.append({
+        logging.info("Received SetChargingProfileRequest: evse_id=%s", evse_id)
+        logging.debug("SetChargingProfileRequest profile: %s", charging_profile)
+        self._set_charging_profile_queue.put_nowait({
             'evse_id': evse_id,
             'charging_profile': charging_profile,
         })
-        self._set_charging_profile_count += 1
-        if self._set_charging_profile_count >= 2:
-            self._all_profiles_received.set()
         return call_result.SetChargingProfile(
             status=ChargingProfileStatusEnumType.accepted
         )
 
 
-@pytest.mark.asyncio
-async def test_tc_k_04():
-    """Replace charging profile - With chargingProfileId."""
-    cp_id = BASIC_AUTH_CP
-    uri = f'{CSMS_ADDRESS}/{cp_id}'
-    headers = get_basic_auth_headers(cp_id, BASIC_AUTH_CP_PASSWORD)
-
-    ws = await websockets.connect(
-        uri=uri,
-        subprotocols=['ocpp2.0.1'],
-        extra_headers=headers,
-    )
-    time.sleep(0.5)
-
-    cp = SmartChargingMockCP(cp_id, ws)
-    start_task = asyncio.create_task(cp.start())
+@pytest.fixture
+def charge_point_class():
+    return SmartChargingMockCP
 
-    boot_response = await cp.send_boot_notification()
-    assert boot_response.status == RegistrationStatusEnumType.accepted
 
-    await cp.send_status_notification(CONNECTOR_ID, ConnectorStatusEnumType.available)
+@pytest.mark.parametrize("connection", [
+    basic_auth_connection()
+], indirect=True)
+async def test_tc_k_04(booted_cp):
+    """Replace charging profile - With chargingProfileId."""
+    cp = booted_cp
 
     # Wait for both SetChargingProfileRequests
-    await asyncio.wait_for(
-        cp._all_profiles_received.wait(),
-        timeout=CSMS_ACTION_TIMEOUT * 2,
+    request1, request2 = await asyncio.wait_for(
+        asyncio.gather(cp._set_charging_profile_queue.get(), cp._set_charging_profile_queue.get()),
+        timeout=C.CSMS_ACTION_TIMEOUT * 2,
     )
 
-    assert len(cp._set_charging_profile_requests) >= 2
-
-    profile1 = cp._set_charging_profile_requests[0]['charging_profile']
-    profile2 = cp._set_charging_profile_requests[1]['charging_profile']
+    profile1 = normalize_charging_profile(request1['charging_profile'])
+    profile2 = normalize_charging_profile(request2['charging_profile'])
 
     # Extract schedule data for both profiles
-    schedules1 = profile1.get('charging_schedule') or profile1.get('chargingSchedule')
-    schedule1 = schedules1[0] if isinstance(schedules1, list) else schedules1
-    periods1 = schedule1.get('charging_schedule_period') or schedule1.get('chargingSchedulePeriod')
+    schedules1 = profile1.charging_schedule
+    schedule1 = schedules1[0]
+    periods1 = schedule1.charging_schedule_period
 
-    schedules2 = profile2.get('charging_schedule') or profile2.get('chargingSchedule')
-    schedule2 = schedules2[0] if isinstance(schedules2, list) else schedules2
-    periods2 = schedule2.get('charging_schedule_period') or schedule2.get('chargingSchedulePeriod')
+    schedules2 = profile2.charging_schedule
+    schedule2 = schedules2[0]
+    periods2 = schedule2.charging_schedule_period
 
     # Step 1: startPeriod must be 0 and limit 8.0 or 8000.0, only one period
     assert len(periods1) == 1, f"Expected first chargingSchedule to contain only one period, got {len(periods1)}"
-    start_period1 = periods1[0].get('start_period') if periods1[0].get('start_period') is not None else periods1[0].get('startPeriod')
+    start_period1 = periods1[0].start_period
     assert start_period1 == 0, f"Expected first startPeriod=0, got {start_period1}"
-    limit1 = periods1[0].get('limit')
-    assert limit1 in (8.0, 8000.0), f"Expected first limit=8.0 or 8000.0, got {limit1}"
+    limit1 = periods1[0].limit
+    assert limit1 in _VALID_FIRST_LIMITS, f"Expected first limit=8.0 or 8000.0, got {limit1}"
 
     # Step 3: startPeriod must be 0 and limit 6.0 or 6000.0, only one period
     assert len(periods2) == 1, f"Expected second chargingSchedule to contain only one period, got {len(periods2)}"
-    start_period2 = periods2[0].get('start_period') if periods2[0].get('start_period') is not None else periods2[0].get('startPeriod')
+    start_period2 = periods2[0].start_period
     assert start_period2 == 0, f"Expected second startPeriod=0, got {start_period2}"
-    limit2 = periods2[0].get('limit')
-    assert limit2 in (6.0, 6000.0), f"Expected second limit=6.0 or 6000.0, got {limit2}"
+    limit2 = periods2[0].limit
+    assert limit2 in _VALID_SECOND_LIMITS, f"Expected second limit=6.0 or 6000.0, got {limit2}"
 
     # Both should have the same chargingProfile.id
-    id1 = profile1.get('id')
-    id2 = profile2.get('id')
+    id1 = profile1.id
+    id2 = profile2.id
     assert id1 == id2, f"Expected same chargingProfile.id, got {id1} and {id2}"
 
     # startSchedule must NOT be omitted for both
-    start_sched1 = schedule1.get('start_schedule') or schedule1.get('startSchedule')
-    start_sched2 = schedule2.get('start_schedule') or schedule2.get('startSchedule')
+    start_sched1 = schedule1.start_schedule
+    start_sched2 = schedule2.start_schedule
     assert start_sched1 is not None, "Expected first profile chargingSchedule.startSchedule to not be omitted"
     assert start_sched2 is not None, "Expected second profile chargingSchedule.startSchedule to not be omitted"
 
     # stackLevel must be present and equal for both
-    stack1 = profile1.get('stack_level') or profile1.get('stackLevel')
-    stack2 = profile2.get('stack_level') or profile2.get('stackLevel')
+    stack1 = profile1.stack_level
+    stack2 = profile2.stack_level
     assert stack1 is not None, "Expected first profile stackLevel to be present"
     assert stack1 == stack2, f"Expected equal stackLevel for both profiles, got {stack1} and {stack2}"
 
     # chargingProfilePurpose must be equal for both and TxDefaultProfile or ChargingStationMaxProfile
-    purpose1 = profile1.get('charging_profile_purpose') or profile1.get('chargingProfilePurpose')
-    purpose2 = profile2.get('charging_profile_purpose') or profile2.get('chargingProfilePurpose')
+    purpose1 = profile1.charging_profile_purpose
+    purpose2 = profile2.charging_profile_purpose
     assert purpose1 == purpose2, f"Expected equal purpose for both profiles, got {purpose1} and {purpose2}"
-    valid_purposes = (
-        'TxDefaultProfile', 'ChargingStationMaxProfile',
-        ChargingProfilePurposeEnumType.tx_default_profile,
-        ChargingProfilePurposeEnumType.charging_station_max_profile,
-    )
-    assert purpose1 in valid_purposes, \
+    assert purpose1 in _VALID_PURPOSES, \
         f"Expected purpose TxDefaultProfile or ChargingStationMaxProfile, got {purpose1}"
 
     # chargingProfileKind must be equal for both
-    kind1 = profile1.get('charging_profile_kind') or profile1.get('chargingProfileKind')
-    kind2 = profile2.get('charging_profile_kind') or profile2.get('chargingProfileKind')
+    kind1 = profile1.charging_profile_kind
+    kind2 = profile2.charging_profile_kind
     assert kind1 == kind2, f"Expected equal kind for both profiles, got {kind1} and {kind2}"
 
     # If ChargingStationMaxProfile then kind must be Absolute
-    if purpose1 in ('ChargingStationMaxProfile', ChargingProfilePurposeEnumType.charging_station_max_profile):
-        assert kind1 in ('Absolute', ChargingProfileKindEnumType.absolute), \
+    if purpose1 == ChargingProfilePurposeEnumType.charging_station_max_profile:
+        assert kind1 == ChargingProfileKindEnumType.absolute, \
             f"ChargingStationMaxProfile requires kind=Absolute, got {kind1}"
 
     # If TxDefaultProfile then kind must be Absolute or Recurring
-    if purpose1 in ('TxDefaultProfile', ChargingProfilePurposeEnumType.tx_default_profile):
-        assert kind1 in ('Absolute', 'Recurring', ChargingProfileKindEnumType.absolute, ChargingProfileKindEnumType.recurring), \
+    if purpose1 == ChargingProfilePurposeEnumType.tx_default_profile:
+        assert kind1 in _VALID_TX_DEFAULT_KINDS, \
             f"TxDefaultProfile requires kind=Absolute or Recurring, got {kind1}"
 
     # If kind is Recurring then recurrencyKind must NOT be omitted, else omitted
-    if kind1 in ('Recurring', ChargingProfileKindEnumType.recurring):
-        recurrency1 = profile1.get('recurrency_kind') or profile1.get('recurrencyKind')
+    if kind1 == ChargingProfileKindEnumType.recurring:
+        recurrency1 = profile1.recurrency_kind
         assert recurrency1 is not None, "Expected recurrencyKind to not be omitted when kind is Recurring"
     else:
-        recurrency1 = profile1.get('recurrency_kind') if profile1.get('recurrency_kind') is not None else profile1.get('recurrencyKind')
+        recurrency1 = profile1.recurrency_kind
         assert recurrency1 is None, \
             f"Expected recurrencyKind to be omitted when kind is not Recurring, got {recurrency1}"
-
-    logging.info("TC_K_04 completed successfully")
-    start_task.cancel()
-    await ws.close()
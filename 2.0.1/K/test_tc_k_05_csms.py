@@ -33,7 +33,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -97,7 +96,6 @@ class SmartChargingMockCP(TziChargePoint):
         )
 
 
-@pytest.mark.asyncio
 async def test_tc_k_05():
     """Clear Charging Profile - With chargingProfileId."""
     cp_id = BASIC_AUTH_CP
@@ -163,6 +161,5 @@ async def test_tc_k_05():
     assert criteria is None, \
         f"Expected chargingProfileCriteria to be omitted, got {criteria}"
 
-    logging.info("TC_K_05 completed successfully")
     start_task.cancel()
     await ws.close()
@@ -24,112 +24,54 @@ Tool validations:
       - evseId <Configured evseId> AND
       - stackLevel <Configured stackLevel>
 """
-import asyncio
-import logging
-import os
-import sys
-import time
-
 import pytest
-import websockets
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from ocpp.routing import on
-from ocpp.v201 import call_result
-from ocpp.v201.enums import (
-    Action,
-    RegistrationStatusEnumType,
-    ConnectorStatusEnumType,
-    ClearChargingProfileStatusEnumType,
-    ChargingProfilePurposeEnumType,
-)
+from ocpp.v201.enums import ChargingProfilePurposeEnumType, ClearChargingProfileStatusEnumType
 
 from tzi_charge_point import TziChargePoint
-from utils import get_basic_auth_headers, now_iso
-
-logging.basicConfig(level=logging.INFO)
-
-CSMS_ADDRESS = os.environ['CSMS_ADDRESS']
-BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP']
-BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
-EVSE_ID = int(os.environ['CONFIGURED_EVSE_ID'])
-CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
-CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
+from utils import CONFIG as C, basic_auth_connection, normalize_charging_profile_criterion
 
 
 class SmartChargingMockCP(TziChargePoint):
+    """Answers ClearChargingProfileRequest with Unknown: no profile was installed."""
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._received_clear_charging_profile = asyncio.Event()
-        self._clear_charging_profile_data = None
-
-    @on(Action.clear_charging_profile)
-    async def on_clear_charging_profile(self, charging_profile_id=None, charging_profile_criteria=None, **kwargs):
-        logging.info(f"Received ClearChargingProfileRequest: id={charging_profile_id}, criteria={charging_profile_criteria}")
-        self._clear_charging_profile_data = {
-            'charging_profile_id': charging_profile_id,
-            'charging_profile_criteria': charging_profile_criteria,
-        }
-        self._received_clear_charging_profile.set()
-        return call_result.ClearChargingProfile(
-            status=ClearChargingProfileStatusEnumType.unknown
-        )
-
-
-@pytest.mark.asyncio
-async def test_tc_k_08():
-    """Clear Charging Profile - Without previous charging profile."""
-    cp_id = BASIC_AUTH_CP
-    uri = f'{CSMS_ADDRESS}/{cp_id}'
-    headers = get_basic_auth_headers(cp_id, BASIC_AUTH_CP_PASSWORD)
+        self._clear_charging_profile_response_status = ClearChargingProfileStatusEnumType.unknown
 
-    ws = await websockets.connect(
-        uri=uri,
-        subprotocols=['ocpp2.0.1'],
-        extra_headers=headers,
-    )
-    time.sleep(0.5)
 
-    cp = SmartChargingMockCP(cp_id, ws)
-    start_task = asyncio.create_task(cp.start())
+@pytest.fixture
+def charge_point_class():
+    return SmartChargingMockCP
 
-    boot_response = await cp.send_boot_notification()
-    assert boot_response.status == RegistrationStatusEnumType.accepted
 
-    await cp.send_status_notification(CONNECTOR_ID, ConnectorStatusEnumType.available)
+@pytest.mark.parametrize("connection", [
+    basic_auth_connection()
+], indirect=True)
+async def test_tc_k_08(booted_cp):
+    """Clear Charging Profile - Without previous charging profile."""
+    cp = booted_cp
 
-    await asyncio.wait_for(
-        cp._received_clear_charging_profile.wait(),
-        timeout=CSMS_ACTION_TIMEOUT,
-    )
+    await cp.wait_for_request(cp._received_clear_charging_profile, C.CSMS_ACTION_TIMEOUT)
 
     assert cp._clear_charging_profile_data is not None
     req_data = cp._clear_charging_profile_data
-    criteria = req_data['charging_profile_criteria']
-
-    assert criteria is not None, "chargingProfileCriteria must be present"
+    assert req_data['charging_profile_criteria'] is not None, "chargingProfileCriteria must be present"
+    criteria = normalize_charging_profile_criterion(req_data['charging_profile_criteria'])
 
     # chargingProfileId must be omitted
     assert req_data['charging_profile_id'] is None, \
         f"Expected chargingProfileId to be omitted, got {req_data['charging_profile_id']}"
 
     # chargingProfilePurpose must be TxDefaultProfile
-    purpose = criteria.get('charging_profile_purpose') or criteria.get('chargingProfilePurpose')
-    assert purpose in ('TxDefaultProfile', ChargingProfilePurposeEnumType.tx_default_profile), \
-        f"Expected purpose=TxDefaultProfile, got {purpose}"
+    assert criteria.charging_profile_purpose == ChargingProfilePurposeEnumType.tx_default_profile, \
+        f"Expected purpose=TxDefaultProfile, got {criteria.charging_profile_purpose}"
 
     # stackLevel must be present
-    stack_level = criteria.get('stack_level') or criteria.get('stackLevel')
-    assert stack_level is not None, "stackLevel must be present"
+    assert criteria.stack_level is not None, "stackLevel must be present"
 
     # evseId must be configured evseId
-    evse_id = criteria.get('evse_id') if criteria.get('evse_id') is not None else criteria.get('evseId')
-    assert evse_id == EVSE_ID, \
-        f"Expected evseId={EVSE_ID}, got {evse_id}"
-
-    # Step 2: Response is Unknown (handled by handler above)
+    assert criteria.evse_id == C.EVSE_ID, \
+        f"Expected evseId={C.EVSE_ID}, got {criteria.evse_id}"
 
-    logging.info("TC_K_08 completed successfully")
-    start_task.cancel()
-    await ws.close()
+    # Step 2: Response is Unknown (set by SmartChargingMockCP above)
@@ -33,7 +33,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -81,7 +80,6 @@ class SmartChargingMockCP(TziChargePoint):
         )
 
 
-@pytest.mark.asyncio
 async def test_tc_k_15():
     """Set Charging Profile - Not Supported."""
     cp_id = BASIC_AUTH_CP
@@ -171,6 +169,5 @@ async def test_tc_k_15():
         assert number_phases is None or number_phases == 3, \
             f"Expected numberPhases=3 or omitted, got {number_phases}"
 
-    logging.info("TC_K_15 completed successfully")
     start_task.cancel()
     await ws.close()
@@ -26,99 +26,50 @@ Tool validations:
       - evseId 0 AND
       - chargingProfile.chargingProfilePurpose <Configured chargingProfilePurpose>
 """
-import asyncio
-import logging
-import os
-import sys
-import time
-
 import pytest
-import websockets
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from ocpp.routing import on
-from ocpp.v201 import call, call_result
-from ocpp.v201.enums import (
-    Action,
-    RegistrationStatusEnumType,
-    ConnectorStatusEnumType,
-    GetChargingProfileStatusEnumType,
-    ChargingLimitSourceEnumType,
-)
-
-from tzi_charge_point import TziChargePoint
-from utils import get_basic_auth_headers, generate_transaction_id, now_iso
+
+from ocpp.v201 import call
+from ocpp.v201.enums import ChargingLimitSourceEnumType
+
+from utils import CONFIG as C, basic_auth_connection, generate_transaction_id, normalize_charging_profile_criterion
 from reusable_states.authorized import authorized
 from reusable_states.energy_transfer_started import energy_transfer_started
 
-logging.basicConfig(level=logging.INFO)
-
-CSMS_ADDRESS = os.environ['CSMS_ADDRESS']
-BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP']
-BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
-VALID_ID_TOKEN = os.environ['VALID_ID_TOKEN']
-VALID_ID_TOKEN_TYPE = os.environ['VALID_ID_TOKEN_TYPE']
-EVSE_ID = int(os.environ['CONFIGURED_EVSE_ID'])
-CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
-CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
-
-
-class SmartChargingMockCP(TziChargePoint):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._received_get_charging_profiles = asyncio.Event()
-        self._get_charging_profiles_data = None
-
-    @on(Action.get_charging_profiles)
-    async def on_get_charging_profiles(self, request_id, charging_profile, evse_id=None, **kwargs):
-        logging.info(f"Received GetChargingProfilesRequest: request_id={request_id}, evse_id={evse_id}")
-        self._get_charging_profiles_data = {
-            'request_id': request_id,
-            'charging_profile': charging_profile,
-            'evse_id': evse_id,
-        }
-        self._received_get_charging_profiles.set()
-        return call_result.GetChargingProfiles(
-            status=GetChargingProfileStatusEnumType.accepted
-        )
-
-
-@pytest.mark.asyncio
-async def test_tc_k_29():
-    """Get Charging Profile - EvseId 0."""
-    cp_id = BASIC_AUTH_CP
-    uri = f'{CSMS_ADDRESS}/{cp_id}'
-    headers = get_basic_auth_headers(cp_id, BASIC_AUTH_CP_PASSWORD)
+# Everything but requestId is fixed; safe to share, as ocpp copies payloads on send.
+_REPORT_TEMPLATE = {
+    'charging_limit_source': ChargingLimitSourceEnumType.cso,
+    'charging_profile': [{
+        'id': 1,
+        'stack_level': 1,
+        'charging_profile_purpose': 'TxDefaultProfile',
+        'charging_profile_kind': 'Absolute',
+        'charging_schedule': [{
+            'id': 1,
+            'charging_rate_unit': 'A',
+            'charging_schedule_period': [{'start_period': 0, 'limit': 6.0}],
+        }],
+    }],
+    'evse_id': 0,
+}
 
-    ws = await websockets.connect(
-        uri=uri,
-        subprotocols=['ocpp2.0.1'],
-        extra_headers=headers,
-    )
-    time.sleep(0.5)
 
-    cp = SmartChargingMockCP(cp_id, ws)
-    start_task = asyncio.create_task(cp.start())
+@pytest.mark.parametrize("connection", [
+    basic_auth_connection()
+], indirect=True)
+async def test_tc_k_29(booted_cp):
+    """Get Charging Profile - EvseId 0."""
+    cp = booted_cp
 
     transaction_id = generate_transaction_id()
 
-    boot_response = await cp.send_boot_notification()
-    assert boot_response.status == RegistrationStatusEnumType.accepted
-
-    await cp.send_status_notification(CONNECTOR_ID, ConnectorStatusEnumType.available)
-
     # Before: Execute Reusable State EnergyTransferStarted
-    await authorized(cp, id_token_id=VALID_ID_TOKEN, id_token_type=VALID_ID_TOKEN_TYPE,
-                     transaction_id=transaction_id, evse_id=EVSE_ID, connector_id=CONNECTOR_ID)
-    await energy_transfer_started(cp, evse_id=EVSE_ID, connector_id=CONNECTOR_ID,
+    await authorized(cp, id_token_id=C.VALID_ID_TOKEN, id_token_type=C.VALID_ID_TOKEN_TYPE,
+                     transaction_id=transaction_id, evse_id=C.EVSE_ID, connector_id=C.CONNECTOR_ID)
+    await energy_transfer_started(cp, evse_id=C.EVSE_ID, connector_id=C.CONNECTOR_ID,
                                   transaction_id=transaction_id)
 
     # Step 1-2: Wait for CSMS to send GetChargingProfilesRequest
-    await asyncio.wait_for(
-        cp._received_get_charging_profiles.wait(),
-        timeout=CSMS_ACTION_TIMEOUT,
-    )
+    await cp.wait_for_request(cp._received_get_charging_profiles, C.CSMS_ACTION_TIMEOUT)
 
     assert cp._get_charging_profiles_data is not None
     req_data = cp._get_charging_profiles_data
@@ -128,19 +79,11 @@ async def test_tc_k_29():
         f"Expected evseId=0, got {req_data['evse_id']}"
 
     # Tool validations for chargingProfile criterion
-    criterion = req_data['charging_profile']
-    purpose = criterion.get('charging_profile_purpose')
-    if purpose is None:
-        purpose = criterion.get('chargingProfilePurpose')
-    stack_level = criterion.get('stack_level')
-    if stack_level is None:
-        stack_level = criterion.get('stackLevel')
-    limit_source = criterion.get('charging_limit_source')
-    if limit_source is None:
-        limit_source = criterion.get('chargingLimitSource')
-    profile_id = criterion.get('charging_profile_id')
-    if profile_id is None:
-        profile_id = criterion.get('chargingProfileId')
+    criterion = normalize_charging_profile_criterion(req_data['charging_profile'])
+    purpose = criterion.charging_profile_purpose
+    stack_level = criterion.stack_level
+    limit_source = criterion.charging_limit_source
+    profile_id = criterion.charging_profile_id
 
     assert purpose is not None, "chargingProfilePurpose must be present in criterion"
     assert stack_level is None, f"Expected stackLevel to be omitted, got {stack_level}"
@@ -149,25 +92,6 @@ async def test_tc_k_29():
 
     # Step 3: Send ReportChargingProfilesRequest
     request_id = req_data['request_id']
-    report_payload = call.ReportChargingProfiles(
-        request_id=request_id,
-        charging_limit_source=ChargingLimitSourceEnumType.cso,
-        charging_profile=[{
-            'id': 1,
-            'stack_level': 1,
-            'charging_profile_purpose': 'TxDefaultProfile',
-            'charging_profile_kind': 'Absolute',
-            'charging_schedule': [{
-                'id': 1,
-                'charging_rate_unit': 'A',
-                'charging_schedule_period': [{'start_period': 0, 'limit': 6.0}],
-            }],
-        }],
-        evse_id=0,
-    )
+    report_payload = call.ReportChargingProfiles(request_id=request_id, **_REPORT_TEMPLATE)
     # Step 4: CSMS responds with ReportChargingProfilesResponse
     await cp.call(report_payload)
-
-    logging.info("TC_K_29 completed successfully")
-    start_task.cancel()
-    await ws.close()
@@ -24,7 +24,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -72,7 +71,6 @@ class SmartChargingMockCP(TziChargePoint):
         )
 
 
-@pytest.mark.asyncio
 async def test_tc_k_30():
     """Get Charging Profile - EvseId > 0."""
     cp_id = BASIC_AUTH_CP
@@ -146,6 +144,5 @@ async def test_tc_k_30():
     )
     await cp.call(report_payload)
 
-    logging.info("TC_K_30 completed successfully")
     start_task.cancel()
     await ws.close()
@@ -20,86 +20,35 @@ Tool validations:
     * Step 1: Message GetChargingProfilesRequest
       - evseId omit
 """
-import asyncio
-import logging
-import os
-import sys
-import time
-
 import pytest
-import websockets
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from ocpp.routing import on
-from ocpp.v201 import call, call_result
-from ocpp.v201.enums import (
-    Action,
-    RegistrationStatusEnumType,
-    ConnectorStatusEnumType,
-    GetChargingProfileStatusEnumType,
-    ChargingLimitSourceEnumType,
-)
-
-from tzi_charge_point import TziChargePoint
-from utils import get_basic_auth_headers, now_iso
-
-logging.basicConfig(level=logging.INFO)
-
-CSMS_ADDRESS = os.environ['CSMS_ADDRESS']
-BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP']
-BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
-EVSE_ID = int(os.environ['CONFIGURED_EVSE_ID'])
-CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
-CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
-
-
-class SmartChargingMockCP(TziChargePoint):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._received_get_charging_profiles = asyncio.Event()
-        self._get_charging_profiles_data = None
-
-    @on(Action.get_charging_profiles)
-    async def on_get_charging_profiles(self, request_id, charging_profile, evse_id=None, **kwargs):
-        logging.info(f"Received GetChargingProfilesRequest: request_id={request_id}, evse_id={evse_id}")
-        self._get_charging_profiles_data = {
-            'request_id': request_id,
-            'charging_profile': charging_profile,
-            'evse_id': evse_id,
-        }
-        self._received_get_charging_profiles.set()
-        return call_result.GetChargingProfiles(
-            status=GetChargingProfileStatusEnumType.accepted
-        )
-
-
-@pytest.mark.asyncio
-async def test_tc_k_31():
-    """Get Charging Profile - No EvseId."""
-    cp_id = BASIC_AUTH_CP
-    uri = f'{CSMS_ADDRESS}/{cp_id}'
-    headers = get_basic_auth_headers(cp_id, BASIC_AUTH_CP_PASSWORD)
-
-    ws = await websockets.connect(
-        uri=uri,
-        subprotocols=['ocpp2.0.1'],
-        extra_headers=headers,
-    )
-    time.sleep(0.5)
 
-    cp = SmartChargingMockCP(cp_id, ws)
-    start_task = asyncio.create_task(cp.start())
+from ocpp.v201 import call
+from ocpp.v201.enums import ChargingLimitSourceEnumType
 
-    boot_response = await cp.send_boot_notification()
-    assert boot_response.status == RegistrationStatusEnumType.accepted
+from utils import CONFIG as C, basic_auth_connection, normalize_charging_profile_criterion
 
-    await cp.send_status_notification(CONNECTOR_ID, ConnectorStatusEnumType.available)
+# Reported for every EVSE.
+_REPORTED_PROFILES = [{
+    'id': 1,
+    'stack_level': 1,
+    'charging_profile_purpose': 'TxDefaultProfile',
+    'charging_profile_kind': 'Absolute',
+    'charging_schedule': [{
+        'id': 1,
+        'charging_rate_unit': 'A',
+        'charging_schedule_period': [{'start_period': 0, 'limit': 6.0}],
+    }],
+}]
 
-    await asyncio.wait_for(
-        cp._received_get_charging_profiles.wait(),
-        timeout=CSMS_ACTION_TIMEOUT,
-    )
+
+@pytest.mark.parametrize("connection", [
+    basic_auth_connection()
+], indirect=True)
+async def test_tc_k_31(booted_cp):
+    """Get Charging Profile - No EvseId."""
+    cp = booted_cp
+
+    await cp.wait_for_request(cp._received_get_charging_profiles, C.CSMS_ACTION_TIMEOUT)
 
     assert cp._get_charging_profiles_data is not None
     req_data = cp._get_charging_profiles_data
@@ -109,59 +58,35 @@ async def test_tc_k_31():
         f"Expected evseId to be omitted, got {req_data['evse_id']}"
 
     # Tool validations for chargingProfile criterion
-    criterion = req_data['charging_profile']
-    purpose = criterion.get('charging_profile_purpose')
-    if purpose is None:
-        purpose = criterion.get('chargingProfilePurpose')
-    stack_level = criterion.get('stack_level')
-    if stack_level is None:
-        stack_level = criterion.get('stackLevel')
-    limit_source = criterion.get('charging_limit_source')
-    if limit_source is None:
-        limit_source = criterion.get('chargingLimitSource')
-    profile_id = criterion.get('charging_profile_id')
-    if profile_id is None:
-        profile_id = criterion.get('chargingProfileId')
+    criterion = normalize_charging_profile_criterion(req_data['charging_profile'])
+    purpose = criterion.charging_profile_purpose
+    stack_level = criterion.stack_level
+    limit_source = criterion.charging_limit_source
+    profile_id = criterion.charging_profile_id
 
     assert purpose is not None, "chargingProfilePurpose must be present in criterion"
     assert stack_level is None, f"Expected stackLevel to be omitted, got {stack_level}"
     assert limit_source is None, f"Expected chargingLimitSource to be omitted, got {limit_source}"
     assert profile_id is None, f"Expected chargingProfileId to be omitted, got {profile_id}"
 
-    # Send ReportChargingProfilesRequest with tbc=true for EVSE 1
     request_id = req_data['request_id']
-    profile_data = {
-        'id': 1,
-        'stack_level': 1,
-        'charging_profile_purpose': 'TxDefaultProfile',
-        'charging_profile_kind': 'Absolute',
-        'charging_schedule': [{
-            'id': 1,
-            'charging_rate_unit': 'A',
-            'charging_schedule_period': [{'start_period': 0, 'limit': 6.0}],
-        }],
-    }
 
     # Send report for EVSE 1 with tbc=true
     report_payload = call.ReportChargingProfiles(
         request_id=request_id,
         charging_limit_source=ChargingLimitSourceEnumType.cso,
-        charging_profile=[profile_data],
+        charging_profile=_REPORTED_PROFILES,
         evse_id=1,
         tbc=True,
     )
-    await cp.call(report_payload)
 
     # Send report for EVSE 1 with tbc=false (last one)
     report_payload_final = call.ReportChargingProfiles(
         request_id=request_id,
         charging_limit_source=ChargingLimitSourceEnumType.cso,
-        charging_profile=[profile_data],
-        evse_id=EVSE_ID,
+        charging_profile=_REPORTED_PROFILES,
+        evse_id=C.EVSE_ID,
         tbc=False,
     )
-    await cp.call(report_payload_final)
-
-    logging.info("TC_K_31 completed successfully")
-    start_task.cancel()
-    await ws.close()
+    # ocpp sends calls one at a time, so the tbc=true report still goes out first.
+    await cp.send_many([report_payload, report_payload_final])
@@ -19,7 +19,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -66,7 +65,6 @@ class SmartChargingMockCP(TziChargePoint):
         )
 
 
-@pytest.mark.asyncio
 async def test_tc_k_32():
     """Get Charging Profile - chargingProfileId."""
     cp_id = BASIC_AUTH_CP
@@ -130,6 +128,5 @@ async def test_tc_k_32():
     )
     await cp.call(report_payload)
 
-    logging.info("TC_K_32 completed successfully")
     start_task.cancel()
     await ws.close()
@@ -19,7 +19,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -59,7 +58,6 @@ class SmartChargingMockCP(TziChargePoint):
         return call_result.GetChargingProfiles(status=GetChargingProfileStatusEnumType.accepted)
 
 
-@pytest.mark.asyncio
 async def test_tc_k_33():
     """Get Charging Profile - EvseId > 0 + stackLevel."""
     cp_id = BASIC_AUTH_CP
@@ -113,6 +111,5 @@ async def test_tc_k_33():
     )
     await cp.call(report_payload)
 
-    logging.info("TC_K_33 completed successfully")
     start_task.cancel()
     await ws.close()
@@ -13,88 +13,32 @@ Tool validations:
       - evseId <Configured evseId> AND
       - chargingProfile.chargingProfilePurpose <Configured chargingProfilePurpose>
 """
-import asyncio
-import logging
-import os
-import sys
-import time
-
 import pytest
-import websockets
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from ocpp.routing import on
-from ocpp.v201 import call, call_result
-from ocpp.v201.enums import (
-    Action, RegistrationStatusEnumType, ConnectorStatusEnumType,
-    GetChargingProfileStatusEnumType, ChargingLimitSourceEnumType,
-)
-from tzi_charge_point import TziChargePoint
-from utils import get_basic_auth_headers, now_iso
-
-logging.basicConfig(level=logging.INFO)
-
-CSMS_ADDRESS = os.environ['CSMS_ADDRESS']
-BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP']
-BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
-EVSE_ID = int(os.environ['CONFIGURED_EVSE_ID'])
-CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
-CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
+from ocpp.v201 import call
+from ocpp.v201.enums import ChargingLimitSourceEnumType
 
-class SmartChargingMockCP(TziChargePoint):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._received_get_charging_profiles = asyncio.Event()
-        self._get_charging_profiles_data = None
+from utils import CONFIG as C, basic_auth_connection, normalize_charging_profile_criterion
 
-    @on(Action.get_charging_profiles)
-    async def on_get_charging_profiles(self, request_id, charging_profile, evse_id=None, **kwargs):
-        logging.info(f"Received GetChargingProfilesRequest: request_id={request_id}, evse_id={evse_id}")
-        self._get_charging_profiles_data = {
-            'request_id': request_id, 'charging_profile': charging_profile, 'evse_id': evse_id,
-        }
-        self._received_get_charging_profiles.set()
-        return call_result.GetChargingProfiles(status=GetChargingProfileStatusEnumType.accepted)
 
-
-@pytest.mark.asyncio
-async def test_tc_k_35():
+@pytest.mark.parametrize("connection", [
+    basic_auth_connection()
+], indirect=True)
+async def test_tc_k_35(booted_cp):
     """Get Charging Profile - EvseId > 0 + chargingProfilePurpose."""
-    cp_id = BASIC_AUTH_CP
-    uri = f'{CSMS_ADDRESS}/{cp_id}'
-    headers = get_basic_auth_headers(cp_id, BASIC_AUTH_CP_PASSWORD)
-
-    ws = await websockets.connect(uri=uri, subprotocols=['ocpp2.0.1'], extra_headers=headers)
-    time.sleep(0.5)
-
-    cp = SmartChargingMockCP(cp_id, ws)
-    start_task = asyncio.create_task(cp.start())
+    cp = booted_cp
 
-    boot_response = await cp.send_boot_notification()
-    assert boot_response.status == RegistrationStatusEnumType.accepted
-    await cp.send_status_notification(CONNECTOR_ID, ConnectorStatusEnumType.available)
-
-    await asyncio.wait_for(cp._received_get_charging_profiles.wait(), timeout=CSMS_ACTION_TIMEOUT)
+    await cp.wait_for_request(cp._received_get_charging_profiles, C.CSMS_ACTION_TIMEOUT)
 
     req_data = cp._get_charging_profiles_data
     assert req_data['evse_id'] is not None and req_data['evse_id'] > 0
 
-    criterion = req_data['charging_profile']
-    purpose = criterion.get('charging_profile_purpose')
-    if purpose is None:
-        purpose = criterion.get('chargingProfilePurpose')
+    criterion = normalize_charging_profile_criterion(req_data['charging_profile'])
+    purpose = criterion.charging_profile_purpose
+    stack_level = criterion.stack_level
+    limit_source = criterion.charging_limit_source
+    profile_id = criterion.charging_profile_id
     assert purpose is not None, "chargingProfilePurpose must be present in criterion"
-    stack_level = criterion.get('stack_level')
-    if stack_level is None:
-        stack_level = criterion.get('stackLevel')
-    limit_source = criterion.get('charging_limit_source')
-    if limit_source is None:
-        limit_source = criterion.get('chargingLimitSource')
-    profile_id = criterion.get('charging_profile_id')
-    if profile_id is None:
-        profile_id = criterion.get('chargingProfileId')
     assert stack_level is None, f"Expected stackLevel to be omitted, got {stack_level}"
     assert limit_source is None, f"Expected chargingLimitSource to be omitted, got {limit_source}"
     assert profile_id is None, f"Expected chargingProfileId to be omitted, got {profile_id}"
@@ -108,10 +52,6 @@ async def test_tc_k_35():
             'charging_schedule': [{'id': 1, 'charging_rate_unit': 'A',
                                    'charging_schedule_period': [{'start_period': 0, 'limit': 6.0}]}],
         }],
-        evse_id=EVSE_ID,
+        evse_id=C.EVSE_ID,
     )
     await cp.call(report_payload)
-
-    logging.info("TC_K_35 completed successfully")
-    start_task.cancel()
-    await ws.close()
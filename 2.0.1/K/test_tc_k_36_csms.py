@@ -20,7 +20,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -60,7 +59,6 @@ class SmartChargingMockCP(TziChargePoint):
         return call_result.GetChargingProfiles(status=GetChargingProfileStatusEnumType.accepted)
 
 
-@pytest.mark.asyncio
 async def test_tc_k_36():
     """Get Charging Profile - EvseId > 0 + chargingProfilePurpose + stackLevel."""
     cp_id = BASIC_AUTH_CP
@@ -114,6 +112,5 @@ async def test_tc_k_36():
     )
     await cp.call(report_payload)
 
-    logging.info("TC_K_36 completed successfully")
     start_task.cancel()
     await ws.close()
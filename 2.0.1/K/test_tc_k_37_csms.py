@@ -47,7 +47,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -77,7 +76,6 @@ CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
 
-@pytest.mark.asyncio
 async def test_tc_k_37():
     """Remote start transaction with charging profile - Success."""
     cp_id = BASIC_AUTH_CP
@@ -170,6 +168,5 @@ async def test_tc_k_37():
     event_response = await cp.send_transaction_event_request(event)
     assert event_response is not None
 
-    logging.info("TC_K_37 completed successfully")
     start_task.cancel()
     await ws.close()
@@ -26,48 +26,23 @@ Tool validations:
       - duration is <Configured duration>
       - chargingRateUnit <Configured chargingRateUnit>
 """
-import asyncio
 import logging
-import os
-import sys
-import time
 
 import pytest
-import websockets
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from ocpp.routing import on
 from ocpp.v201 import call_result
-from ocpp.v201.enums import (
-    Action,
-    RegistrationStatusEnumType,
-    ConnectorStatusEnumType,
-    GenericStatusEnumType,
-)
+from ocpp.v201.enums import Action, GenericStatusEnumType
 
 from tzi_charge_point import TziChargePoint
-from utils import get_basic_auth_headers, now_iso
-
-logging.basicConfig(level=logging.INFO)
-
-CSMS_ADDRESS = os.environ['CSMS_ADDRESS']
-BASIC_AUTH_CP = os.environ['BASIC_AUTH_CP']
-BASIC_AUTH_CP_PASSWORD = os.environ['BASIC_AUTH_CP_PASSWORD']
-CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
-CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
+from utils import CONFIG as C, basic_auth_connection, now_iso
 
 
 class SmartChargingMockCP(TziChargePoint):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._received_get_composite_schedule = asyncio.Event()
-        self._get_composite_schedule_data = None
-
     @on(Action.get_composite_schedule)
     async def on_get_composite_schedule(self, duration, evse_id, charging_rate_unit=None, **kwargs):
-        logging.info(f"Received GetCompositeScheduleRequest: duration={duration}, evse_id={evse_id}, "
-                     f"charging_rate_unit={charging_rate_unit}")
+        logging.info("Received GetCompositeScheduleRequest: duration=%s, evse_id=%s, charging_rate_unit=%s",
+                     duration, evse_id, charging_rate_unit)
         self._get_composite_schedule_data = {
             'duration': duration,
             'evse_id': evse_id,
@@ -93,24 +68,19 @@ class SmartChargingMockCP(TziChargePoint):
         )
 
 
-@pytest.mark.asyncio
-async def test_tc_k_43():
-    """Get Composite Schedule - Specific EVSE."""
-    cp_id = BASIC_AUTH_CP
-    uri = f'{CSMS_ADDRESS}/{cp_id}'
-    headers = get_basic_auth_headers(cp_id, BASIC_AUTH_CP_PASSWORD)
-
-    ws = await websockets.connect(uri=uri, subprotocols=['ocpp2.0.1'], extra_headers=headers)
-    time.sleep(0.5)
+@pytest.fixture
+def charge_point_class():
+    return SmartChargingMockCP
 
-    cp = SmartChargingMockCP(cp_id, ws)
-    start_task = asyncio.create_task(cp.start())
 
-    boot_response = await cp.send_boot_notification()
-    assert boot_response.status == RegistrationStatusEnumType.accepted
-    await cp.send_status_notification(CONNECTOR_ID, ConnectorStatusEnumType.available)
+@pytest.mark.parametrize("connection", [
+    basic_auth_connection()
+], indirect=True)
+async def test_tc_k_43(booted_cp):
+    """Get Composite Schedule - Specific EVSE."""
+    cp = booted_cp
 
-    await asyncio.wait_for(cp._received_get_composite_schedule.wait(), timeout=CSMS_ACTION_TIMEOUT)
+    await cp.wait_for_request(cp._received_get_composite_schedule, C.CSMS_ACTION_TIMEOUT)
 
     assert cp._get_composite_schedule_data is not None
     req_data = cp._get_composite_schedule_data
@@ -123,7 +93,3 @@ async def test_tc_k_43():
 
     # chargingRateUnit must be present
     assert req_data['charging_rate_unit'] is not None, "chargingRateUnit must be present"
-
-    logging.info("TC_K_43 completed successfully")
-    start_task.cancel()
-    await ws.close()
@@ -24,7 +24,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -72,7 +71,6 @@ class SmartChargingMockCP(TziChargePoint):
         )
 
 
-@pytest.mark.asyncio
 async def test_tc_k_44():
     """Get Composite Schedule - Charging Station."""
     cp_id = BASIC_AUTH_CP
@@ -96,6 +94,5 @@ async def test_tc_k_44():
     assert req_data['duration'] is not None, "duration must be present"
     assert req_data['charging_rate_unit'] is not None, "chargingRateUnit must be present"
 
-    logging.info("TC_K_44 completed successfully")
     start_task.cancel()
     await ws.close()
@@ -22,7 +22,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -46,7 +45,6 @@ CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
 
-@pytest.mark.asyncio
 async def test_tc_k_48():
     """Set / Update External Charging Limit (not on a transaction)."""
     cp_id = BASIC_AUTH_CP
@@ -73,6 +71,5 @@ async def test_tc_k_48():
     response = await cp.call(payload)
     assert response is not None
 
-    logging.info("TC_K_48 completed successfully")
     start_task.cancel()
     await ws.close()
@@ -35,7 +35,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -93,7 +92,6 @@ class SmartChargingMockCP(TziChargePoint):
         )
 
 
-@pytest.mark.asyncio
 async def test_tc_k_53():
     """Charging with load leveling - Success (ISO15118SmartCharging)."""
     cp_id = BASIC_AUTH_CP
@@ -194,6 +192,5 @@ async def test_tc_k_53():
     assert cp._set_charging_profile_count == profile_count_before, \
         "CSMS must NOT send additional SetChargingProfileRequest after ISO15118SmartCharging"
 
-    logging.info("TC_K_53 completed successfully")
     start_task.cancel()
     await ws.close()
@@ -55,7 +55,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -119,7 +118,6 @@ class SmartChargingMockCP(TziChargePoint):
         )
 
 
-@pytest.mark.asyncio
 async def test_tc_k_55():
     """Charging with load leveling - EV charging profile exceeds limits."""
     cp_id = BASIC_AUTH_CP
@@ -236,6 +234,5 @@ async def test_tc_k_55():
     assert schedule2_response is not None
     assert schedule2_response.status in (GenericStatusEnumType.accepted, 'Accepted')
 
-    logging.info("TC_K_55 completed successfully")
     start_task.cancel()
     await ws.close()
@@ -32,7 +32,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -113,7 +112,6 @@ async def _execute_iso15118_smart_charging(cp, transaction_id):
     await cp.send_transaction_event_request(event)
 
 
-@pytest.mark.asyncio
 async def test_tc_k_58():
     """Renegotiating a Charging Schedule - Initiated by CSMS."""
     cp_id = BASIC_AUTH_CP
@@ -163,6 +161,5 @@ async def test_tc_k_58():
     sched_response = await cp.call(notify_sched)
     assert sched_response.status in (GenericStatusEnumType.accepted, 'Accepted')
 
-    logging.info("TC_K_58 completed successfully")
     start_task.cancel()
     await ws.close()
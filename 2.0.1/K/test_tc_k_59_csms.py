@@ -39,7 +39,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -128,7 +127,6 @@ async def _execute_iso15118_smart_charging(cp, transaction_id):
     await cp.send_transaction_event_request(event)
 
 
-@pytest.mark.asyncio
 async def test_tc_k_59():
     """Renegotiating a Charging Schedule - Initiated by CSMS - Send NotifyEVChargingNeeds."""
     cp_id = BASIC_AUTH_CP
@@ -212,6 +210,5 @@ async def test_tc_k_59():
     sched_response = await cp.call(notify_sched)
     assert sched_response.status in (GenericStatusEnumType.accepted, 'Accepted')
 
-    logging.info("TC_K_59 completed successfully")
     start_task.cancel()
     await ws.close()
@@ -34,7 +34,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -86,7 +85,6 @@ class SmartChargingMockCP(TziChargePoint):
         )
 
 
-@pytest.mark.asyncio
 async def test_tc_k_60():
     """Set Charging Profile - TxProfile with ongoing transaction."""
     cp_id = BASIC_AUTH_CP
@@ -165,6 +163,5 @@ async def test_tc_k_60():
     start_period = first_period.get('start_period') if first_period.get('start_period') is not None else first_period.get('startPeriod')
     assert start_period == 0, f"K01.FR.31: Expected startPeriod=0, got {start_period}"
 
-    logging.info("TC_K_60 completed successfully")
     start_task.cancel()
     await ws.close()
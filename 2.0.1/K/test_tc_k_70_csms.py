@@ -25,7 +25,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -80,7 +79,6 @@ class SmartChargingMockCP(TziChargePoint):
         )
 
 
-@pytest.mark.asyncio
 async def test_tc_k_70():
     """Set Charging Profile - Multiple Profiles."""
     cp_id = BASIC_AUTH_CP
@@ -168,6 +166,5 @@ async def test_tc_k_70():
         assert start_period == 0, \
             f"K01.FR.31: Profile {idx} expected startPeriod=0, got {start_period}"
 
-    logging.info("TC_K_70 completed successfully")
     start_task.cancel()
     await ws.close()
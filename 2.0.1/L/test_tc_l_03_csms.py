@@ -45,7 +45,6 @@ import sys
 import time
 from datetime import datetime
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -72,7 +71,6 @@ CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
 
-@pytest.mark.asyncio
 async def test_tc_l_03():
     """Secure Firmware Update - DownloadScheduled."""
     cp_id = BASIC_AUTH_CP
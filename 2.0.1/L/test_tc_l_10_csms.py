@@ -43,7 +43,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -115,7 +114,6 @@ class FirmwareCancelMockCP(TziChargePoint):
             )
 
 
-@pytest.mark.asyncio
 async def test_tc_l_10():
     """Secure Firmware Update - AcceptedCanceled."""
     cp_id = BASIC_AUTH_CP
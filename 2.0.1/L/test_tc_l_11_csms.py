@@ -43,7 +43,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -114,7 +113,6 @@ class FirmwareRejectMockCP(TziChargePoint):
             )
 
 
-@pytest.mark.asyncio
 async def test_tc_l_11():
     """Secure Firmware Update - Unable to cancel."""
     cp_id = BASIC_AUTH_CP
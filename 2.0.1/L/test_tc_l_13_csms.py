@@ -55,7 +55,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -90,7 +89,6 @@ VALID_ID_TOKEN_TYPE = os.environ['VALID_ID_TOKEN_TYPE']
 TRANSACTION_DURATION = int(os.environ['TRANSACTION_DURATION'])
 
 
-@pytest.mark.asyncio
 async def test_tc_l_13():
     """Secure Firmware Update - Ongoing transaction."""
     cp_id = BASIC_AUTH_CP
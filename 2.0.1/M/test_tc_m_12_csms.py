@@ -38,7 +38,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -76,7 +75,6 @@ def make_certificate_hash_data_chain(cert_type, hash_algorithm):
     }]
 
 
-@pytest.mark.asyncio
 async def test_tc_m_12():
     """Retrieve certificates from Charging Station - CSMSRootCertificate."""
     cp_id = BASIC_AUTH_CP
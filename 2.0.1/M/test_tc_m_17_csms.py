@@ -58,7 +58,6 @@ CONNECTOR_ID = int(os.environ['CONFIGURED_CONNECTOR_ID'])
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
 
-@pytest.mark.asyncio
 async def test_tc_m_17():
     """Retrieve certificates from Charging Station - CSMSRootCertificate & ManufacturerRootCertificate."""
     cp_id = BASIC_AUTH_CP
@@ -45,7 +45,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -69,7 +68,6 @@ CONFIGURED_EVSE_ID = int(os.environ['CONFIGURED_EVSE_ID'])
 CSMS_ACTION_TIMEOUT = int(os.environ['CSMS_ACTION_TIMEOUT'])
 
 
-@pytest.mark.asyncio
 async def test_tc_n_08():
     """Set Variable Monitoring - One SetMonitoringData element."""
     cp_id = BASIC_AUTH_CP
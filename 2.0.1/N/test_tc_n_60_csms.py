@@ -55,7 +55,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -106,7 +105,6 @@ def validate_component_variable_list(component_variable, evse_id):
         f"variable.name=AvailabilityState, got {component_variable}"
 
 
-@pytest.mark.asyncio
 async def test_tc_n_60():
     """Get Monitoring Report - with component criteria and list of components/variables."""
     cp_id = BASIC_AUTH_CP
@@ -42,7 +42,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -70,7 +69,6 @@ VALID_IDTOKEN_IDTOKEN = os.environ['VALID_IDTOKEN_IDTOKEN']
 VALID_IDTOKEN_TYPE = os.environ['VALID_IDTOKEN_TYPE']
 
 
-@pytest.mark.asyncio
 async def test_tc_o_06():
     """Set Display Message - Specific transaction - Success."""
     cp_id = BASIC_AUTH_CP
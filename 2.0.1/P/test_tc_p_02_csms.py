@@ -37,7 +37,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -67,7 +66,6 @@ ALLOWED_STATUSES = {
 }
 
 
-@pytest.mark.asyncio
 async def test_tc_p_02():
     """Data Transfer to the CSMS - Rejected / Unknown VendorId / Unknown MessageId."""
     cp_id = BASIC_AUTH_CP
@@ -32,7 +32,6 @@ import os
 import sys
 import time
 
-import pytest
 import websockets
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -63,7 +62,6 @@ CUSTOM_DATA = {
 }
 
 
-@pytest.mark.asyncio
 async def test_tc_p_03():
     """CustomData - Receive custom data."""
     cp_id = BASIC_AUTH_CP
@@ -1,21 +1,51 @@
+import asyncio
+import logging
 import os
-import sys
-from pathlib import Path
+import pytest
 import pytest_asyncio
 import websockets
 from websockets import InvalidStatusCode
 from dataclasses import dataclass
-import time
 
-# Keep imports stable after test tree moves:
-# allow resolving helper modules from both repo root and version folder.
-_VERSION_ROOT = Path(__file__).resolve().parent
-_PROJECT_ROOT = _VERSION_ROOT.parent
-for _path in (str(_VERSION_ROOT), str(_PROJECT_ROOT)):
-    if _path not in sys.path:
-        sys.path.insert(0, _path)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Opt-in pytest-xdist support for a CSMS with one registered charge point per
+# worker: with XDIST_CP_PER_WORKER=true, worker gwN connects as
+# <BASIC_AUTH_CP>_<N+1>. This has to happen before utils reads the environment.
+_XDIST_WORKER = os.environ.get('PYTEST_XDIST_WORKER')
+if _XDIST_WORKER and os.environ.get('XDIST_CP_PER_WORKER', 'false').lower() == 'true':
+    os.environ['BASIC_AUTH_CP'] = f"{os.environ['BASIC_AUTH_CP']}_{int(_XDIST_WORKER[2:]) + 1}"
+
+from ocpp.v201.enums import ConnectorStatusEnumType, RegistrationStatusEnumType
+
+from tzi_charge_point import TziChargePoint
+from utils import CONFIG
+
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO').upper())
+
+CSMS_ADDRESS = CONFIG.CSMS_ADDRESS
+
+
+def pytest_configure(config):
+    # Environment settings are parsed once, when utils is first imported.
+    config.tzi_env = CONFIG
+
+
+@pytest.fixture(scope="session")
+def tzi_env(pytestconfig):
+    return pytestconfig.tzi_env
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    # The suite is websocket I/O bound; use uvloop when it is installed.
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
 
-CSMS_ADDRESS = os.environ['CSMS_ADDRESS']
 
 @dataclass
 class MockConnection:
@@ -35,7 +65,40 @@ async def connection(request):
         return
 
     # Some delay is required by some CSMS prior to being able to handle data sent
-    time.sleep(0.5)
+    await asyncio.sleep(0.5)
     yield ws
 
     await ws.close()
+
+
+@pytest.fixture
+def charge_point_class():
+    return TziChargePoint
+
+
+@pytest_asyncio.fixture
+async def charge_point(request, connection, charge_point_class):
+    """A started (not yet booted) charge point on the test's `connection`.
+
+    Function scoped on purpose: the mock CSMS drives each test case by the
+    order of connections and messages it sees, so a charge point shared
+    across tests would leak state between them.
+    """
+    cp_name, _ = request.node.callspec.params['connection']
+    async with charge_point_class(cp_name, connection) as cp:
+        yield cp
+
+
+@pytest_asyncio.fixture
+async def booted_cp(charge_point, tzi_env):
+    """`charge_point` after an accepted BootNotification and Available status."""
+    boot_response = await charge_point.send_boot_notification()
+    assert boot_response.status == RegistrationStatusEnumType.accepted
+
+    await charge_point.send_status_notification(tzi_env.CONNECTOR_ID, ConnectorStatusEnumType.available)
+    return charge_point
+
+
+def pytest_runtest_logreport(report):
+    if report.when == "call" and report.passed:
+        logging.info("%s completed successfully", report.nodeid)
@@ -77,11 +77,12 @@ async def energy_transfer_started(cp: TziChargePoint, evse_id: int, connector_id
 
     await cp.send_notify_event([event_data])
 
+    cable_plugged_seq_no, charging_state_changed_seq_no = cp.reserve_seq_nos(2)
     cable_plugged_event = TransactionEvent(
         event_type=TransactionEventType.updated,
         timestamp=now_iso(),
         trigger_reason=TriggerReasonType.cable_plugged_in,
-        seq_no=cp.next_seq_no(),
+        seq_no=cable_plugged_seq_no,
         transaction_info={
             "transaction_id": transaction_id,
             "charging_state": ChargingStateType.ev_connected,
@@ -99,7 +100,7 @@ async def energy_transfer_started(cp: TziChargePoint, evse_id: int, connector_id
         event_type=TransactionEventType.updated,
         timestamp=now_iso(),
         trigger_reason=TriggerReasonType.charging_state_changed,
-        seq_no=cp.next_seq_no(),
+        seq_no=charging_state_changed_seq_no,
         transaction_info={
             "transaction_id": transaction_id,
             "charging_state": ChargingStateType.charging,
@@ -3,6 +3,7 @@ import dataclasses
 from typing import List
 import logging
 
+import ocpp.messages
 from ocpp.routing import on
 from ocpp.v201 import call, call_result
 from ocpp.v201 import ChargePoint
@@ -40,7 +41,10 @@ from ocpp.v201.enums import (
     ClearMessageStatusEnumType,
 )
 
-from utils import now_iso
+from utils import OCPP_JSON, close_charge_point, now_iso
+
+if OCPP_JSON is not None:
+    ocpp.messages.json = OCPP_JSON
 
 
 class AttributeDict(dict):
@@ -71,10 +75,13 @@ def _wrap_dicts(obj):
 
 class TziChargePoint(ChargePoint):
     seq_no = 0
+    notify_event_seq_no = 1231230
     notify_event_sent = False
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._started = asyncio.Event()
+        self._start_task = None
         self._received_set_variables = asyncio.Event()
         self._received_trigger_message = asyncio.Event()
         self._received_certificate_signed = asyncio.Event()
@@ -198,6 +205,12 @@ class TziChargePoint(ChargePoint):
         self.seq_no += 1
         return self.seq_no
 
+    def reserve_seq_nos(self, n):
+        """Take the next `n` sequence numbers at once, as a range."""
+        start = self.seq_no + 1
+        self.seq_no += n
+        return range(start, self.seq_no + 1)
+
     def get_notify_event_type(self):
         if self.notify_event_sent:
             return 'Updated'
@@ -212,7 +225,43 @@ class TziChargePoint(ChargePoint):
         )
         return _wrap_dicts(response)
 
+    async def send_many(self, calls, skip_schema_validation=True):
+        """Send several call payloads and return their responses in order."""
+        return await asyncio.gather(*[
+            self.call(c, skip_schema_validation=skip_schema_validation) for c in calls
+        ])
+
+    async def __aenter__(self):
+        self._start_task = asyncio.create_task(self.start())
+        await self._started.wait()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await close_charge_point(self._start_task, self._connection)
+
+    async def wait_for_request(self, event, timeout):
+        """Wait up to `timeout` seconds for a handler to set `event`.
+
+        Fails as soon as the connection to the CSMS drops instead of running
+        out the timeout. Only for charge points started with `async with`.
+        """
+        if self._start_task is None:
+            raise RuntimeError("wait_for_request() needs a charge point started with `async with`")
+        waiter = asyncio.ensure_future(event.wait())
+        try:
+            done, _ = await asyncio.wait({waiter, self._start_task}, timeout=timeout,
+                                         return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+        if waiter in done:
+            return
+        if self._start_task in done:
+            error = None if self._start_task.cancelled() else self._start_task.exception()
+            raise ConnectionError("Connection to the CSMS closed while waiting for a request") from error
+        raise TimeoutError(f"No request from the CSMS within {timeout}s")
+
     async def start(self):
+        self._started.set()
         try:
             await super().start()
         except asyncio.CancelledError:
@@ -236,11 +285,11 @@ class TziChargePoint(ChargePoint):
         response = await self.call(payload)
         return response
 
-    async def send_status_notification(self, connector_id, status, evse_id=1):
+    async def send_status_notification(self, connector_id, status, evse_id=1, timestamp=None):
         logging.info(f"Sending StatusNotification for evse {evse_id} connector {connector_id} with status {status}...")
 
         payload = call.StatusNotification(
-            timestamp=now_iso(),
+            timestamp=timestamp or now_iso(),
             connector_id=connector_id,
             evse_id=evse_id,
             connector_status=status
@@ -249,8 +298,8 @@ class TziChargePoint(ChargePoint):
         logging.info("Received StatusNotification response.")
         return await self.call(payload)
 
-    async def send_notify_event(self, data: List[EventDataType]):
-        payload = call.NotifyEvent(generated_at=now_iso(), seq_no=1231230, event_data=data)
+    async def send_notify_event(self, data: List[EventDataType], generated_at=None):
+        payload = call.NotifyEvent(generated_at=generated_at or now_iso(), seq_no=self.notify_event_seq_no, event_data=data)
         return await self.call(payload)
 
     async def send_authorization_request(self, id_token, token_type, skip_schema_validation=False):
@@ -673,6 +722,46 @@ class TziChargePoint(ChargePoint):
             status=self._set_network_profile_response_status
         )
 
+    @on(Action.set_charging_profile)
+    async def on_set_charging_profile(self, evse_id, charging_profile, **kwargs):
+        logging.info("Received SetChargingProfileRequest: evse_id=%s", evse_id)
+        logging.debug("SetChargingProfileRequest profile: %s", charging_profile)
+        self._set_charging_profile_data = {
+            'evse_id': evse_id,
+            'charging_profile': charging_profile,
+        }
+        self._received_set_charging_profile.set()
+        return call_result.SetChargingProfile(
+            status=self._set_charging_profile_response_status
+        )
+
+    @on(Action.clear_charging_profile)
+    async def on_clear_charging_profile(self, charging_profile_id=None, charging_profile_criteria=None, **kwargs):
+        logging.info("Received ClearChargingProfileRequest: id=%s", charging_profile_id)
+        logging.debug("ClearChargingProfileRequest criteria: %s", charging_profile_criteria)
+        self._clear_charging_profile_data = {
+            'charging_profile_id': charging_profile_id,
+            'charging_profile_criteria': charging_profile_criteria,
+        }
+        self._received_clear_charging_profile.set()
+        return call_result.ClearChargingProfile(
+            status=self._clear_charging_profile_response_status
+        )
+
+    @on(Action.get_charging_profiles)
+    async def on_get_charging_profiles(self, request_id, charging_profile, evse_id=None, **kwargs):
+        logging.info("Received GetChargingProfilesRequest: request_id=%s, evse_id=%s", request_id, evse_id)
+        logging.debug("GetChargingProfilesRequest criterion: %s", charging_profile)
+        self._get_charging_profiles_data = {
+            'request_id': request_id,
+            'charging_profile': charging_profile,
+            'evse_id': evse_id,
+        }
+        self._received_get_charging_profiles.set()
+        return call_result.GetChargingProfiles(
+            status=self._get_charging_profiles_response_status
+        )
+
     async def send_get_certificate_status_request(self, ocsp_request_data):
         payload = call.GetCertificateStatus(ocsp_request_data=ocsp_request_data)
         return await self.call(payload)
@@ -1,15 +1,33 @@
+import asyncio
 import json
 import os
+import random
 import ssl
 import jsonschema
 import base64
+import decimal
+import functools
 from pathlib import Path
-from dataclasses import asdict
+from dataclasses import asdict, dataclass
 import humps
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
+from types import MappingProxyType, SimpleNamespace
 import uuid
-logging.basicConfig(level=logging.INFO)
+
+import websockets
+from ocpp.v201.enums import EventNotificationEnumType, EventTriggerEnumType
+
+try:
+    from asyncio import timeout
+except ImportError:  # Python < 3.11
+    from async_timeout import timeout
+
+try:
+    import orjson
+except ImportError:  # optional, ocpp keeps using the stdlib encoder
+    orjson = None
+
 
 _UTILS_DIR = Path(__file__).resolve().parent
 _SCHEMA_DIR = _UTILS_DIR / 'schema'
@@ -21,6 +39,73 @@ _VERSIONED_SCHEMA_DIRS = (
 )
 
 
+def _env_flag(value):
+    return value.lower() == 'true'
+
+
+# RunConfig field -> (environment variable, type)
+_RUN_CONFIG_ENV = {
+    'CSMS_ADDRESS': ('CSMS_ADDRESS', str),
+    'BASIC_AUTH_CP': ('BASIC_AUTH_CP', str),
+    'BASIC_AUTH_CP_PASSWORD': ('BASIC_AUTH_CP_PASSWORD', str),
+    'EVSE_ID': ('CONFIGURED_EVSE_ID', int),
+    'CONNECTOR_ID': ('CONFIGURED_CONNECTOR_ID', int),
+    'CSMS_ACTION_TIMEOUT': ('CSMS_ACTION_TIMEOUT', int),
+    'VALID_ID_TOKEN': ('VALID_ID_TOKEN', str),
+    'VALID_ID_TOKEN_TYPE': ('VALID_ID_TOKEN_TYPE', str),
+    'TRANSACTION_DURATION': ('TRANSACTION_DURATION', int),
+    'CLOCK_ALIGNED_INTERVAL': ('CLOCK_ALIGNED_METER_VALUES_INTERVAL', int),
+    'NUMBER_PHASES': ('CONFIGURED_NUMBER_PHASES', int),
+    'TX_ENDED_METER_VALUES_INTERVAL': ('TX_ENDED_METER_VALUES_INTERVAL', int),
+    'TX_VIRTUAL_CLOCK': ('TX_VIRTUAL_CLOCK', _env_flag),
+}
+
+# Optional settings and the value used when they are not set.
+_RUN_CONFIG_DEFAULTS = {
+    'TX_VIRTUAL_CLOCK': 'true',
+}
+
+
+@dataclass(frozen=True, slots=True)
+class RunConfig:
+    """Test-run settings; field names match what the test modules used as constants."""
+    CSMS_ADDRESS: str
+    BASIC_AUTH_CP: str
+    BASIC_AUTH_CP_PASSWORD: str
+    EVSE_ID: int
+    CONNECTOR_ID: int
+    CSMS_ACTION_TIMEOUT: int
+    VALID_ID_TOKEN: str
+    VALID_ID_TOKEN_TYPE: str
+    TRANSACTION_DURATION: int
+    CLOCK_ALIGNED_INTERVAL: int
+    NUMBER_PHASES: int
+    TX_ENDED_METER_VALUES_INTERVAL: int
+    TX_VIRTUAL_CLOCK: bool
+
+    @classmethod
+    def from_env(cls):
+        env = {**_RUN_CONFIG_DEFAULTS, **os.environ}
+        missing = [env_name for env_name, _ in _RUN_CONFIG_ENV.values() if env_name not in env]
+        if missing:
+            raise KeyError(f"Missing required environment variables: {', '.join(missing)}")
+        return cls(**{field: cast(env[env_name]) for field, (env_name, cast) in _RUN_CONFIG_ENV.items()})
+
+
+@functools.lru_cache(maxsize=None)
+def _run_config():
+    return RunConfig.from_env()
+
+
+def __getattr__(name):
+    # CONFIG is read from the environment on first use (pytest-env populates it
+    # before any test module is collected), so importing utils outside a test
+    # run, e.g. from csms.py, does not need the test environment.
+    if name == 'CONFIG':
+        return _run_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _resolve_path(path_value):
     path = Path(path_value)
     if path.is_absolute():
@@ -36,16 +121,27 @@ def _resolve_path(path_value):
             return str(candidate.resolve())
     return str((_UTILS_DIR / path).resolve())
 
+@functools.lru_cache(maxsize=None)
 def get_basic_auth_headers(username, password):
     auth_string = base64.b64encode(f"{username}:{password}".encode()).decode()
-    headers = {
+    # Read-only: the cached mapping is shared by every caller.
+    headers = MappingProxyType({
         "Authorization": f"Basic {auth_string}"
-    }
+    })
 
     return headers
 
 
-def validate_schema(data, schema_file_name):
+@functools.lru_cache(maxsize=None)
+def basic_auth_connection():
+    """`connection` fixture parameter for BASIC_AUTH_CP, built once per session."""
+    config = _run_config()
+    return config.BASIC_AUTH_CP, get_basic_auth_headers(config.BASIC_AUTH_CP, config.BASIC_AUTH_CP_PASSWORD)
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_validator(schema_file_name):
+    """Draft 6 validator for a schema file, loaded and compiled once per file."""
     schema_candidates = [
         _SCHEMA_DIR / schema_file_name,
         _PROJECT_SCHEMA_DIR / schema_file_name,
@@ -64,25 +160,26 @@ def validate_schema(data, schema_file_name):
             f"Schema '{schema_file_name}' not found. Tried: {attempted}"
         )
 
-    schema_file_name = str(schema_path)
-    with open(schema_file_name) as schema_file:
-        schema = json.load(schema_file)
-        data = humps.camelize(asdict(data))
-        data = _remove_nones(data)
-        try:
-            is_valid, errors = validate_json_draft06(instance=data, schema=schema)
-            if not is_valid:
-                logging.info(errors)
+    with open(schema_path) as schema_file:
+        return jsonschema.Draft6Validator(json.load(schema_file))
+
 
-            return is_valid
-        except jsonschema.exceptions.ValidationError as err:
-            logging.info(err.message)
-            return False
+def validate_schema(data, schema_file_name):
+    validator = _schema_validator(schema_file_name)
+    data = humps.camelize(asdict(data))
+    data = _remove_nones(data)
+    try:
+        is_valid, errors = _validation_errors(validator, data)
+        if not is_valid:
+            logging.info(errors)
 
+        return is_valid
+    except jsonschema.exceptions.ValidationError as err:
+        logging.info(err.message)
+        return False
 
-def validate_json_draft06(instance, schema):
-    validator = jsonschema.Draft6Validator(schema)
 
+def _validation_errors(validator, instance):
     errors = []
     for error in sorted(validator.iter_errors(instance), key=str):
         # Format error message with path
@@ -218,8 +315,168 @@ def save_cert_chain_to_temp(cert_chain_pem):
     return f.name
 
 
+def _orjson_default(obj):
+    # Mirrors ocpp.messages._DecimalEncoder for the types orjson can't encode.
+    if isinstance(obj, decimal.Decimal):
+        return float("%.1f" % obj)
+    try:
+        return obj.to_json()
+    except AttributeError:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _orjson_dumps(obj, **kwargs):
+    # ocpp passes compact separators and its Decimal encoder class; orjson
+    # output is already compact and Decimals go through _orjson_default.
+    # OCPP-J frames must be text, so the bytes are decoded before sending.
+    return orjson.dumps(obj, default=_orjson_default).decode()
+
+
+def _orjson_loads(s, **kwargs):
+    # ocpp parses incoming frames with plain loads(); the schema validation
+    # paths ask for parse_float=Decimal, which orjson has no equivalent of.
+    if kwargs:
+        return json.loads(s, **kwargs)
+    return orjson.loads(s)
+
+
+# Stand-in for the ``json`` module that ocpp.messages (de)serializes frames with.
+OCPP_JSON = SimpleNamespace(
+    dumps=_orjson_dumps,
+    loads=_orjson_loads,
+    JSONDecodeError=json.JSONDecodeError,
+    JSONEncoder=json.JSONEncoder,
+) if orjson is not None else None
+
+
 def now_iso():
-    return datetime.now().isoformat() + "Z"
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+_TX_ID_POOL = []
+
 
 def generate_transaction_id():
-    return str(uuid.uuid4())
+    # Random bytes for a batch of ids are drawn in one urandom call and
+    # handed out one per call; each id is still a distinct version 4 UUID.
+    if not _TX_ID_POOL:
+        raw = os.urandom(16 * 256)
+        _TX_ID_POOL.extend(str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, len(raw), 16))
+    return _TX_ID_POOL.pop()
+
+
+def availability_event(actual_value, timestamp, event_id, evse=None):
+    """NotifyEvent eventData for a Connector AvailabilityState change."""
+    component = {'name': 'Connector'}
+    if evse is not None:
+        component['evse'] = evse
+    return [{
+        'trigger': EventTriggerEnumType.delta,
+        'actual_value': actual_value,
+        'component': component,
+        'variable': {'name': 'AvailabilityState'},
+        'timestamp': timestamp,
+        'event_id': event_id,
+        'event_notification_type': EventNotificationEnumType.custom_monitor,
+    }]
+
+
+_MISS = object()
+
+
+def pick(data, *keys, default=None):
+    """Value of the first of `keys` present in `data`, e.g. pick(p, 'stack_level', 'stackLevel').
+
+    Unlike chaining `.get(a) or .get(b)`, falsy values such as 0 are returned as-is.
+    """
+    for key in keys:
+        value = data.get(key, _MISS)
+        if value is not _MISS:
+            return value
+    return default
+
+
+def _field_aliases(*names):
+    return {name: (name, humps.camelize(name)) for name in names}
+
+
+_PROFILE_FIELDS = _field_aliases(
+    'id', 'stack_level', 'charging_profile_purpose', 'charging_profile_kind', 'recurrency_kind',
+    'valid_from', 'valid_to', 'transaction_id', 'charging_schedule',
+)
+_SCHEDULE_FIELDS = _field_aliases(
+    'id', 'start_schedule', 'duration', 'charging_rate_unit', 'min_charging_rate', 'charging_schedule_period',
+)
+_PERIOD_FIELDS = _field_aliases('start_period', 'limit', 'number_phases', 'phase_to_use')
+_CRITERION_FIELDS = _field_aliases(
+    'evse_id', 'stack_level', 'charging_profile_purpose', 'charging_profile_id', 'charging_limit_source',
+)
+
+
+def _normalize_fields(data, fields):
+    return SimpleNamespace(**{name: pick(data, *aliases) for name, aliases in fields.items()})
+
+
+def normalize_charging_profile(profile):
+    """ChargingProfile as nested namespaces with snake_case attributes, whichever case it arrived in.
+
+    chargingSchedule is always a list; fields that are absent are None.
+    """
+    normalized = _normalize_fields(profile, _PROFILE_FIELDS)
+    schedules = normalized.charging_schedule
+    if schedules is None:
+        return normalized
+    if not isinstance(schedules, list):
+        schedules = [schedules]
+    normalized.charging_schedule = []
+    for schedule in schedules:
+        schedule = _normalize_fields(schedule, _SCHEDULE_FIELDS)
+        if schedule.charging_schedule_period is not None:
+            schedule.charging_schedule_period = [
+                _normalize_fields(period, _PERIOD_FIELDS) for period in schedule.charging_schedule_period
+            ]
+        normalized.charging_schedule.append(schedule)
+    return normalized
+
+
+def normalize_charging_profile_criterion(criterion):
+    """Clear/GetChargingProfiles criterion as a namespace with snake_case attributes; absent fields are None."""
+    return _normalize_fields(criterion, _CRITERION_FIELDS)
+
+
+async def _await_cancelled(task):
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+async def close_charge_point(start_task, ws, close_timeout=2.0):
+    """Cancel the charge point reader task and close its websocket.
+
+    Cancellation and the close handshake run concurrently and are bounded by
+    `close_timeout`, so a stalled close cannot hang the end of a test; whatever
+    is still pending then is cancelled and drained.
+    """
+    start_task.cancel()
+    closing = [asyncio.ensure_future(ws.close()), asyncio.ensure_future(_await_cancelled(start_task))]
+    _, pending = await asyncio.wait(closing, timeout=close_timeout)
+    for future in pending:
+        future.cancel()
+    await asyncio.gather(*closing, return_exceptions=True)
+
+
+async def connect_with_retry(uri, *, max_attempts=3, base=0.1, cap=1.0, connect_timeout=10.0, **kwargs):
+    """Open a websocket connection, retrying transient failures.
+
+    Connection errors and handshake timeouts are retried with jittered
+    exponential backoff; an HTTP rejection (InvalidStatusCode) is raised
+    immediately since retrying cannot change the outcome.
+    """
+    for attempt in range(max_attempts):
+        try:
+            return await asyncio.wait_for(websockets.connect(uri, **kwargs), timeout=connect_timeout)
+        except (OSError, asyncio.TimeoutError):
+            if attempt == max_attempts - 1:
+                raise
+            await asyncio.sleep(min(cap, base * 2 ** attempt) + random.uniform(0, 0.05))